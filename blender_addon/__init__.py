@@ -11,17 +11,30 @@ bl_info = {
     "category": "Render",
 }
 
+import atexit
 import base64
+import binascii
+import hashlib
+import importlib.util
 import json
+import mmap
+import os
 import queue
+import random
+import re
 import shutil
+import socket
 import tempfile
 import threading
 import time
+import zlib
+from collections import OrderedDict, deque
 from datetime import datetime
 from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
 
 import bpy
 from bpy.props import (
@@ -33,12 +46,73 @@ from bpy.props import (
     StringProperty,
 )
 from bpy.types import AddonPreferences, Operator, Panel, PropertyGroup, UIList
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 
 try:
-    import requests
+    import orjson
 except ImportError:
-    requests = None
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        # Compact separators match orjson's output and keep request bodies small.
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+# pybase64 ships SIMD decoders; binascii is the scalar stdlib fallback.
+if pybase64 is not None:
+    _b64decode = partial(pybase64.b64decode, validate=False)
+else:
+    _b64decode = binascii.a2b_base64
+
+
+# endpoint -> {"health": ..., "upload": ..., "render": ...}
+_URL_CACHE = {}
+
+
+def _service_urls(endpoint: str) -> dict:
+    urls = _URL_CACHE.get(endpoint)
+    if urls is None:
+        base = endpoint.rstrip("/")
+        urls = {
+            "health": base + "/healthz",
+            "upload": base + "/upload-url",
+            "render": base + "/render",
+            "render_binary": base + "/render-binary",
+            "render_batch": base + "/render-batch",
+        }
+        _URL_CACHE.clear()
+        _URL_CACHE[endpoint] = urls
+    return urls
+
+
+def _prefetch_dns(endpoint: str) -> None:
+    """Resolve the service host once so the OS resolver cache is warm for the first job."""
+
+    parts = urlsplit(endpoint)
+    if not parts.hostname:
+        return
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except (OSError, ValueError):
+        pass
+
+
+def _on_endpoint_change(self, _context) -> None:
+    _URL_CACHE.clear()
+    if self.endpoint:
+        _service_urls(self.endpoint)
+        threading.Thread(target=_prefetch_dns, args=(self.endpoint,), daemon=True).start()
 
 
 class RFarmAddonPreferences(AddonPreferences):
@@ -48,6 +122,7 @@ class RFarmAddonPreferences(AddonPreferences):
         name="Cloud Run endpoint",
         description="Base URL of the R-Farm Cloud Run render worker",
         default="",
+        update=_on_endpoint_change,
     )
     auth_token: StringProperty(
         name="Auth token",
@@ -58,24 +133,28 @@ class RFarmAddonPreferences(AddonPreferences):
         default="",
         subtype="PASSWORD",
     )
+    compress_uploads: BoolProperty(
+        name="Compress uploads",
+        description=(
+            "Save the uploaded .blend with Blender's Zstandard compression. "
+            "Slower to export, but much smaller to upload on slow connections"
+        ),
+        default=False,
+    )
 
     def draw(self, _context):
         layout = self.layout
         layout.prop(self, "endpoint")
         layout.prop(self, "auth_token")
+        layout.prop(self, "compress_uploads")
 
 
 class RFarmLogEntry(PropertyGroup):
-    timestamp: FloatProperty(
-        name="Timestamp",
-        description="Unix timestamp of the log entry",
-        default=0.0,
-    )
-    message: StringProperty(
-        name="Message",
-        description="Log message emitted during the remote render",
-        default="",
-    )
+    # One of these is allocated per visible log row, so keep the RNA definition
+    # minimal: rows are never shown in tooltips and only the label is drawn.
+    timestamp: IntProperty(name="Timestamp", default=0)
+    message: StringProperty(name="Message", default="")
+    time_label: StringProperty(name="Time Label", default="")
 
 
 class RFarmStatus(PropertyGroup):
@@ -154,13 +233,8 @@ class RFarm_UL_status_log(UIList):
 
     def draw_item(self, _context, layout, _data, item, _icon, _active_data, _active_propname, _index):
         if self.layout_type in {"DEFAULT", "COMPACT"}:
-            timestamp = datetime.fromtimestamp(item.timestamp) if item.timestamp else None
-            if timestamp:
-                time_label = timestamp.strftime("%H:%M:%S")
-            else:
-                time_label = "--:--:--"
             row = layout.row()
-            row.label(text=time_label, icon="TIME")
+            row.label(text=item.time_label or "--:--:--", icon="TIME")
             row.label(text=item.message)
         elif self.layout_type == "GRID":
             layout.alignment = "CENTER"
@@ -182,7 +256,7 @@ class RFarm_PT_panel(Panel):
         scene = context.scene
         status = scene.rfarm_status
 
-        layout.label(text="Submit the active frame to the configured R-Farm backend.")
+        layout.label(text="Submit the active frame or a frame range to the configured R-Farm backend.")
         if status.is_rendering:
             status_message = status.current_status or "Waiting for response from R-Farm"
             layout.label(text=f"Status: {status_message}", icon="TIME")
@@ -205,6 +279,7 @@ class RFarm_PT_panel(Panel):
         row = layout.row()
         row.enabled = not status.is_rendering
         row.operator(RFarm_OT_render_frame.bl_idname, icon="RENDER_STILL")
+        row.operator(RFarm_OT_render_range.bl_idname, icon="RENDER_ANIMATION")
 
 
 def _ensure_output_directory(path: Path) -> None:
@@ -229,6 +304,56 @@ def _find_available_output_path(path: Path) -> Path:
         counter += 1
 
 
+SHM_DIR = Path("/dev/shm")
+SHM_MIN_FREE_BYTES = 1 << 30
+
+
+def _scratch_root() -> Optional[str]:
+    """Prefer a memory-backed directory for the exported .blend when it has room for it."""
+
+    if not SHM_DIR.is_dir() or not os.access(SHM_DIR, os.W_OK):
+        return None
+
+    needed = SHM_MIN_FREE_BYTES
+    if bpy.data.filepath and os.path.exists(bpy.data.filepath):
+        needed = max(needed, 2 * os.path.getsize(bpy.data.filepath))
+    try:
+        if shutil.disk_usage(SHM_DIR).free < needed:
+            return None
+    except OSError:
+        return None
+    return str(SHM_DIR)
+
+
+# scratch root (None for the system temp dir) -> directory reused for the session
+_SESSION_TMPDIRS = {}
+
+
+def _job_scratch_dir(root: Optional[str], scene_key: int) -> Path:
+    """Return the per-scene scratch directory, creating it once per Blender session.
+
+    Jobs overwrite the same files instead of creating and removing a fresh
+    directory per submission; everything is removed when Blender exits.
+    """
+
+    session_dir = _SESSION_TMPDIRS.get(root)
+    if session_dir is None or not session_dir.is_dir():
+        session_dir = Path(tempfile.mkdtemp(prefix="rfarm_", dir=root))
+        _SESSION_TMPDIRS[root] = session_dir
+    scene_dir = session_dir / f"scene_{scene_key}"
+    scene_dir.mkdir(exist_ok=True)
+    return scene_dir
+
+
+def _remove_session_tmpdirs() -> None:
+    for session_dir in _SESSION_TMPDIRS.values():
+        shutil.rmtree(session_dir, ignore_errors=True)
+    _SESSION_TMPDIRS.clear()
+
+
+atexit.register(_remove_session_tmpdirs)
+
+
 def _collect_render_metadata(scene) -> dict:
     render = scene.render
     cycles = scene.cycles
@@ -248,82 +373,414 @@ def _collect_render_metadata(scene) -> dict:
     return metadata
 
 
-def _prepare_base_payload(scene) -> dict:
-    payload = {
-        "frame": scene.frame_current,
-        "render_settings": _collect_render_metadata(scene),
-    }
+PAYLOAD_CACHE_SIZE = 8
+_PAYLOAD_CACHE: "OrderedDict[tuple, Tuple[dict, bytes]]" = OrderedDict()
+
+
+def _payload_cache_key(scene, device: str, compute_device: str) -> tuple:
+    # Key on the values themselves: properties set from Python are not seen by
+    # depsgraph handlers until the next evaluation, which may not happen first.
+    render = scene.render
+    image_settings = render.image_settings
+    cycles = scene.cycles
+    return (
+        scene.as_pointer(),
+        scene.frame_current,
+        render.resolution_x,
+        render.resolution_y,
+        render.resolution_percentage,
+        getattr(cycles, "samples", None),
+        getattr(cycles, "preview_samples", None),
+        getattr(cycles, "use_adaptive_sampling", None),
+        image_settings.file_format,
+        image_settings.color_mode,
+        image_settings.color_depth,
+        render.use_file_extension,
+        render.filepath,
+        device,
+        compute_device,
+    )
+
+
+def _prepare_base_payload(scene) -> Tuple[dict, bytes]:
+    """Return the per-frame payload and its JSON serialisation minus the closing brace.
+
+    The prefix is serialised once per cache entry so every request body can be
+    built by splicing in the .blend reference instead of re-encoding the dict.
+    """
 
     cycles = scene.cycles
-    payload["device"] = getattr(cycles, "device", "CPU")
+    device = getattr(cycles, "device", "CPU")
 
     compute_device = "CUDA"
-    if getattr(cycles, "device", "CPU") == "GPU":
+    if device == "GPU":
         prefs = bpy.context.preferences.addons.get("cycles")
         if prefs:
             compute_device = getattr(prefs.preferences, "compute_device_type", "CUDA")
-    payload["compute_device_type"] = compute_device
 
-    return payload
+    key = _payload_cache_key(scene, device, compute_device)
+    cached = _PAYLOAD_CACHE.get(key)
+    if cached is not None:
+        _PAYLOAD_CACHE.move_to_end(key)
+    else:
+        base = {
+            "frame": scene.frame_current,
+            "render_settings": _collect_render_metadata(scene),
+            "device": device,
+            "compute_device_type": compute_device,
+        }
+        cached = (base, _json_dumps(base)[:-1])
+        _PAYLOAD_CACHE[key] = cached
+        if len(_PAYLOAD_CACHE) > PAYLOAD_CACHE_SIZE:
+            _PAYLOAD_CACHE.popitem(last=False)
+
+    base, prefix = cached
+    payload = dict(base)
+    payload["render_settings"] = dict(base["render_settings"])
+    return payload, prefix
 
 
 class UploadURLNotSupported(RuntimeError):
-    """Raised when the remote worker does not expose the /upload-url endpoint."""
+    """Raised when the remote worker cannot hand out upload URLs.
 
+    Legacy deployments lack /upload-url (404); workers without a Cloud Storage
+    bucket answer it with 501.
+    """
 
-def _build_payload(
-    base_payload: dict,
-    blend_gcs_uri: Optional[str],
-    blend_inline: Optional[str],
-) -> dict:
-    payload = dict(base_payload)
 
+def _build_payload(
+    payload_prefix: bytes, blend_gcs_uri: Optional[str], frames: Optional[Iterable[int]] = None
+) -> bytes:
+    body = payload_prefix
+    if frames is not None:
+        body += b',"frames":' + _json_dumps(list(frames))
     if blend_gcs_uri:
-        payload["blend_gcs_uri"] = blend_gcs_uri
-    if blend_inline:
-        payload["blend_file"] = blend_inline
+        body += b',"blend_gcs_uri":' + _json_dumps(blend_gcs_uri)
+    return body + b"}"
+
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+UPLOAD_PROGRESS_INTERVAL = 4 << 20
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip a chunked body on the fly (level 1) so it is never compressed in full."""
+
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+_session = None
+
+
+ERROR_BODY_LIMIT = 512
+
 
-    return payload
+def _short_body(response, limit: int = ERROR_BODY_LIMIT) -> str:
+    """Return the start of an error response body without reading or decoding all of it."""
 
+    head = next(response.iter_content(limit), b"")
+    return head[:limit].decode("utf-8", "replace")
 
-def _request_upload_url(endpoint: str, auth_token: str, blend_path: Path) -> Tuple[str, str]:
-    url = endpoint.rstrip("/") + "/upload-url"
-    headers = {"Content-Type": "application/json"}
-    if auth_token:
-        headers["Authorization"] = f"Bearer {auth_token}"
 
-    request_payload = {"filename": blend_path.name}
+def _requests_available() -> bool:
+    # requests drags in urllib3, idna, certifi and more, so it is only imported
+    # when the first job needs a session; until then just check it is installed.
+    return importlib.util.find_spec("requests") is not None
 
-    response = requests.post(url, headers=headers, json=request_payload, timeout=60)
-    if response.status_code == 404:
+
+def _get_session():
+    """Return the shared HTTP session so jobs reuse pooled TCP/TLS connections."""
+
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+        # Plain http:// is used when pointing the add-on at a local worker.
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def _auth_headers(auth_token: str) -> dict:
+    """Build the service Authorization header once per job.
+
+    It is not set on the shared session because Cloud Storage rejects signed URL
+    requests that also carry a bearer token.
+    """
+
+    return {"Authorization": f"Bearer {auth_token}"} if auth_token else {}
+
+
+def _warm_up_endpoint(session, endpoint: str, auth_headers: dict) -> dict:
+    """Open a pooled connection to the service (and wake a cold instance) ahead of use.
+
+    Returns the health check payload, which advertises optional service features.
+    """
+
+    import requests
+
+    try:
+        with session.get(_service_urls(endpoint)["health"], headers=auth_headers, timeout=(3.05, 10)) as response:
+            if response.status_code >= 400:
+                return {}
+            health = _json_loads(response.content)
+    except (requests.RequestException, ValueError):
+        return {}
+    return health if isinstance(health, dict) else {}
+
+
+UPLOAD_URL_ATTEMPTS = 3
+
+
+def _request_upload_url(
+    session, endpoint: str, auth_headers: dict, blend_path: Path, sha256: str
+) -> Tuple[Optional[str], str]:
+    """Request a signed upload URL for ``blend_path``.
+
+    Returns ``(None, gcs_uri)`` when the service already stores a file with the
+    same SHA-256 digest, in which case the upload can be skipped.
+    """
+
+    import requests
+
+    url = _service_urls(endpoint)["upload"]
+    headers = {"Content-Type": "application/json", **auth_headers}
+
+    request_payload = {"filename": blend_path.name, "sha256": sha256}
+
+    body = _json_dumps(request_payload)
+    # Signing has no side effects, so unlike /render this POST is safe to retry.
+    for attempt in range(UPLOAD_URL_ATTEMPTS):
+        try:
+            response = session.post(url, headers=headers, data=body, timeout=60)
+        except requests.ConnectionError:
+            if attempt + 1 == UPLOAD_URL_ATTEMPTS:
+                raise
+            time.sleep(0.5 * (attempt + 1))
+            continue
+        if response.status_code not in (502, 503, 504) or attempt + 1 == UPLOAD_URL_ATTEMPTS:
+            break
+        time.sleep(0.5 * (attempt + 1))
+    if response.status_code in (404, 501):
         raise UploadURLNotSupported(
-            "Remote worker does not expose /upload-url (legacy deployment)"
+            "Remote worker does not support /upload-url (legacy deployment or no Cloud Storage bucket)"
         )
     if response.status_code >= 400:
-        raise RuntimeError(f"Failed to request upload URL: HTTP {response.status_code} {response.text}")
+        raise RuntimeError(f"Failed to request upload URL: HTTP {response.status_code} {_short_body(response)}")
 
     try:
-        payload = response.json()
+        payload = _json_loads(response.content)
     except ValueError as exc:
         raise RuntimeError("Upload URL response was not valid JSON") from exc
 
     upload_url = payload.get("upload_url")
     gcs_uri = payload.get("gcs_uri")
+    if gcs_uri and payload.get("already_uploaded"):
+        return None, gcs_uri
     if not upload_url or not gcs_uri:
         raise RuntimeError("Upload URL response missing required fields")
 
     return upload_url, gcs_uri
 
 
-def _upload_blend_to_gcs(upload_url: str, blend_path: Path) -> None:
-    headers = {"Content-Type": "application/octet-stream", "Content-Length": str(blend_path.stat().st_size)}
-    with open(blend_path, "rb") as handle:
-        response = requests.put(upload_url, data=handle, headers=headers, timeout=300)
+UPLOAD_CACHE_SIZE = 16
+# (endpoint, sha256) -> gcs_uri of .blend files uploaded during this session.
+_UPLOAD_CACHE: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+
+def _hash_file(path: Path) -> str:
+    with open(path, "rb") as handle:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        if os.fstat(handle.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        # Python < 3.11 (Blender 3.x): hash a read-only mapping in one call, which
+        # avoids copying the file through Python and releases the GIL meanwhile.
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return hashlib.sha256(view).hexdigest()
+
+
+def _remember_upload(cache_key: Tuple[str, str], gcs_uri: str) -> None:
+    _UPLOAD_CACHE[cache_key] = gcs_uri
+    _UPLOAD_CACHE.move_to_end(cache_key)
+    if len(_UPLOAD_CACHE) > UPLOAD_CACHE_SIZE:
+        _UPLOAD_CACHE.popitem(last=False)
+
+
+class _ChunkedFileReader:
+    """Iterable request body that streams a file in large chunks.
+
+    Exposing ``__len__`` lets ``requests`` send a regular ``Content-Length`` header
+    (required by signed URL PUTs) instead of switching to chunked transfer encoding.
+    """
+
+    def __init__(self, path: Path, progress: Optional[Callable[[int], None]] = None):
+        self._path = path
+        self._size = path.stat().st_size
+        self._progress = progress
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[memoryview]:
+        sent = 0
+        last_report = 0
+        # One buffer is refilled in place and handed out as a view; each chunk is
+        # fully sent before the next read, so no per-chunk bytes object is needed.
+        buffer = bytearray(UPLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(self._path, "rb", buffering=0) as handle:
+            while True:
+                count = handle.readinto(buffer)
+                if not count:
+                    break
+                sent += count
+                if self._progress and sent - last_report >= UPLOAD_PROGRESS_INTERVAL:
+                    self._progress(sent)
+                    last_report = sent
+                yield view[:count]
+
+
+def _upload_blend_to_gcs(
+    session,
+    upload_url: str,
+    blend_path: Path,
+    progress: Optional[Callable[[int], None]] = None,
+) -> None:
+    body = _ChunkedFileReader(blend_path, progress)
+    headers = {"Content-Type": "application/octet-stream", "Content-Length": str(len(body))}
+    response = session.put(upload_url, data=body, headers=headers, timeout=300)
     if response.status_code not in (200, 201):
-        raise RuntimeError(f"Upload to Cloud Storage failed: HTTP {response.status_code} {response.text}")
+        raise RuntimeError(f"Upload to Cloud Storage failed: HTTP {response.status_code} {_short_body(response)}")
+
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+RENDER_ACCEPT_HEADER = "application/octet-stream, application/json;q=0.5"
+
+
+def _resolve_final_path(
+    output_path_str: str, fallback_dir: Path, remote_format: str, frame: Optional[int] = None
+) -> Path:
+    if output_path_str:
+        final_path = Path(output_path_str)
+        _ensure_output_directory(final_path)
+        return _find_available_output_path(final_path)
+
+    fallback_dir.mkdir(parents=True, exist_ok=True)
+    if frame is None:
+        fallback_name = f"rfarm_frame.{remote_format.lower()}"
+    else:
+        fallback_name = f"rfarm_frame_{frame:04d}.{remote_format.lower()}"
+    return _find_available_output_path(fallback_dir / fallback_name)
+
+
+def _write_chunks(path: Path, chunks: Iterable[bytes]) -> None:
+    with open(path, "wb") as out_file:
+        for chunk in chunks:
+            out_file.write(chunk)
+        out_file.flush()
+        os.fsync(out_file.fileno())
+
+
+def _extract_base64_field(chunks: Iterable[bytes], field: str, out_file) -> Tuple[dict, bool]:
+    """Decode a base64 string field of a streamed JSON body straight into ``out_file``.
+
+    Only the decoder's 4-character carry-over is buffered for the field itself, so
+    large images never exist in memory as a whole. Returns the remaining JSON object
+    (with the field emptied) and whether the field was present.
+    """
+
+    marker = re.compile(rb'"' + re.escape(field.encode("ascii")) + rb'"\s*:\s*"')
+    head = bytearray()
+    tail = bytearray()
+    pending = b""
+    state = "head"
+
+    for chunk in chunks:
+        if state == "head":
+            head += chunk
+            match = marker.search(head)
+            if match is None:
+                continue
+            chunk = bytes(head[match.end():])
+            del head[match.end():]
+            state = "field"
+
+        if state == "field":
+            end = chunk.find(b'"')
+            data = pending + (chunk if end < 0 else chunk[:end]).replace(b"\\", b"")
+            usable = len(data) - len(data) % 4
+            out_file.write(_b64decode(data[:usable]))
+            pending = data[usable:]
+            if end < 0:
+                continue
+            if pending:
+                out_file.write(_b64decode(pending))
+            chunk = chunk[end:]
+            state = "tail"
+
+        tail += chunk
+
+    if state == "field":
+        raise RuntimeError("Truncated response while reading image data")
+
+    try:
+        payload = _json_loads(bytes(head + tail) if state == "tail" else bytes(head))
+    except ValueError as exc:
+        raise RuntimeError("Invalid JSON response") from exc
+    return payload, state == "tail"
+
+
+def _write_batch_results(
+    lines: Iterable[bytes], frames: dict, fallback_dir: Path, log: Callable[[str], None]
+) -> Tuple[str, Optional[Path], int, int]:
+    """Write each frame of an NDJSON /render-batch response to disk as it arrives.
+
+    Returns the last job id, the last written path, and the number of frames that
+    were written and that failed.
+    """
+
+    job_id = ""
+    last_path: Optional[Path] = None
+    written = failed = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = _json_loads(line)
+        except ValueError as exc:
+            raise RuntimeError("Invalid line in batch render response") from exc
+
+        frame = record.get("frame")
+        if record.get("error") is not None or not record.get("image_base64"):
+            failed += 1
+            log(f"Frame {frame} failed: {record.get('error') or 'missing image data'}")
+            continue
+
+        remote_format = record.get("output_format", "PNG")
+        final_path = _resolve_final_path(frames.get(frame, ""), fallback_dir, remote_format, frame)
+        _write_chunks(final_path, (_b64decode(record["image_base64"]),))
+        job_id = record.get("job_id", job_id)
+        last_path = final_path
+        written += 1
+        log(f"Frame {frame} saved to {final_path.name}")
+    return job_id, last_path, written, failed
 
 
 ACTIVE_RENDER_JOBS = {}
+# Incremented whenever a scene's status changes so open popups know when to redraw.
+STATUS_REVISIONS = {}
 
 
 def _format_elapsed(elapsed_seconds: float) -> str:
@@ -333,136 +790,289 @@ def _format_elapsed(elapsed_seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
+MAX_LOG_ENTRIES = 500
+VISIBLE_LOG_ENTRIES = 200
+# scene pointer -> deque of (timestamp, message, time_label); the full session log.
+_LOGS_BY_SCENE = {}
+# scene pointer -> [entries appended, entries mirrored into the UI collection]
+_LOG_VERSIONS = {}
+
+
+def _reset_log(status: RFarmStatus) -> None:
+    scene_key = status.id_data.as_pointer()
+    _LOGS_BY_SCENE[scene_key] = deque(maxlen=MAX_LOG_ENTRIES)
+    _LOG_VERSIONS[scene_key] = [0, 0]
+    status.log_entries.clear()
+    status.log_index = 0
+
+
+def _sync_visible_logs(status: RFarmStatus) -> None:
+    """Mirror the newest log lines into the UI collection, touching only what changed."""
+
+    scene_key = status.id_data.as_pointer()
+    store = _LOGS_BY_SCENE.get(scene_key)
+    version = _LOG_VERSIONS.get(scene_key)
+    if not store or version is None or version[0] == version[1]:
+        return
+
+    entries = status.log_entries
+    pending = version[0] - version[1]
+    if pending >= VISIBLE_LOG_ENTRIES:
+        entries.clear()
+        pending = min(len(store), VISIBLE_LOG_ENTRIES)
+    for timestamp, message, time_label in islice(store, len(store) - pending, None):
+        entry = entries.add()
+        entry.timestamp = int(timestamp)
+        entry.message = message
+        entry.time_label = time_label
+    while len(entries) > VISIBLE_LOG_ENTRIES:
+        entries.remove(0)
+    status.log_index = max(0, len(entries) - 1)
+    version[1] = version[0]
+
+
+def _append_log_entries(status: RFarmStatus, logs: Iterable[Tuple[float, str]]) -> None:
+    scene_key = status.id_data.as_pointer()
+    store = _LOGS_BY_SCENE.setdefault(scene_key, deque(maxlen=MAX_LOG_ENTRIES))
+    version = _LOG_VERSIONS.setdefault(scene_key, [0, 0])
+    for timestamp, message in logs:
+        timestamp = timestamp or time.time()
+        store.append((timestamp, message, time.strftime("%H:%M:%S", time.localtime(timestamp))))
+        version[0] += 1
+    _sync_visible_logs(status)
+
+
 def _append_log_entry(status: RFarmStatus, message: str, timestamp: Optional[float] = None) -> None:
-    entry = status.log_entries.add()
-    entry.timestamp = timestamp or time.time()
-    entry.message = message
-    status.log_index = max(0, len(status.log_entries) - 1)
+    _append_log_entries(status, ((timestamp, message),))
+
+
+def _cleanup_job_files(tmpdir: Path, blend_path: Path) -> None:
+    """Remove the job's scratch files; the directory is kept for the next job."""
+
+    for path in (blend_path, tmpdir / "result.part"):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
 
 def _run_remote_render_job(job_args: dict) -> None:
-    job_queue: queue.Queue = job_args["queue"]
+    job_events: deque = job_args["events"]
     endpoint: str = job_args["endpoint"]
-    auth_token: str = job_args["auth_token"]
+    auth_headers = _auth_headers(job_args["auth_token"])
     blend_path = Path(job_args["blend_path"])
     tmpdir = Path(job_args["tmpdir"])
-    base_payload = job_args["base_payload"]
+    payload_prefix: bytes = job_args["payload_prefix"]
     output_path_str: str = job_args["output_path"]
     fallback_dir = Path(job_args["fallback_dir"])
-    requests_module = job_args["requests_module"]
+    session = job_args["session"]
+    blend_ready: threading.Event = job_args["blend_ready"]
+    wake: threading.Event = job_args["wake"]
+
+    def emit(kind: str, timestamp: float, payload) -> None:
+        # deque.append is atomic under the GIL; the event wakes the UI timer.
+        job_events.append((kind, timestamp, payload))
+        wake.set()
 
     def log(message: str) -> None:
-        job_queue.put(("log", time.time(), message))
+        emit("log", time.time(), message)
 
     def update_status(message: Optional[str] = None, *, timestamp: Optional[float] = None, **extra) -> None:
         payload = dict(extra)
         if message is not None:
             payload["message"] = message
-        job_queue.put(("status", timestamp or time.time(), payload))
+        emit("status", timestamp or time.time(), payload)
 
+    # The scratch directory is shared by every job of the scene. A job dropped
+    # because its save failed must not delete a later submission's files.
+    owns_files = False
     try:
         upload_start: Optional[float] = None
         upload_end_recorded = False
         render_start: Optional[float] = None
         render_end_recorded = False
-
-        if requests_module is None:
-            raise RuntimeError(
-                "Python module 'requests' is required. Install it in Blender's Python environment."
+        cache_key: Optional[Tuple[str, str]] = None
+
+        health = _warm_up_endpoint(session, endpoint, auth_headers)
+        blend_ready.wait()
+        if job_args.get("blend_error"):
+            return
+        owns_files = True
+
+        update_status("Checking .blend file for changes")
+        cache_key = (endpoint, _hash_file(blend_path))
+        gcs_uri: Optional[str] = _UPLOAD_CACHE.get(cache_key)
+        send_binary = False
+        frames: Optional[dict] = job_args.get("frames")
+
+        def upload_blend() -> Optional[str]:
+            """Upload the .blend through a signed URL; None if the service cannot sign one."""
+
+            nonlocal upload_start, upload_end_recorded
+            log("Requesting upload URL from R-Farm service")
+            update_status("Requesting upload URL from R-Farm service")
+            try:
+                upload_url, uploaded_uri = _request_upload_url(
+                    session, endpoint, auth_headers, blend_path, cache_key[1]
+                )
+            except UploadURLNotSupported:
+                log("Service does not support upload URLs, sending .blend file with the render request")
+                return None
+            if upload_url is None:
+                log("Service already has this .blend file, skipping upload")
+            else:
+                log("Upload URL received, uploading .blend file")
+                upload_start = time.time()
+                upload_end_recorded = False
+                update_status(
+                    "Uploading .blend file to R-farm",
+                    timestamp=upload_start,
+                    upload_start=upload_start,
+                )
+                blend_size = blend_path.stat().st_size
+                _upload_blend_to_gcs(
+                    session,
+                    upload_url,
+                    blend_path,
+                    lambda sent: log(f"Uploaded {sent >> 20} of {blend_size >> 20} MiB"),
+                )
+                upload_end = time.time()
+                update_status("Upload complete", timestamp=upload_end, upload_end=upload_end)
+                upload_end_recorded = True
+                log("Blend file uploaded successfully")
+            _remember_upload(cache_key, uploaded_uri)
+            return uploaded_uri
+
+        def build_request() -> Tuple[str, dict, object]:
+            if frames and send_binary:
+                raise RuntimeError("Frame range renders require a service that supports upload URLs")
+
+            headers = {"Accept": RENDER_ACCEPT_HEADER, **auth_headers}
+            if frames:
+                headers["Content-Type"] = "application/json"
+                headers["Accept"] = "application/x-ndjson"
+                body = _build_payload(payload_prefix, gcs_uri, frames)
+                return _service_urls(endpoint)["render_batch"], headers, body
+            if not send_binary:
+                headers["Content-Type"] = "application/json"
+                body = _build_payload(payload_prefix, gcs_uri)
+                return _service_urls(endpoint)["render"], headers, body
+
+            # The .blend travels as the raw body; the settings ride along in a header.
+            headers["Content-Type"] = "application/octet-stream"
+            headers["X-RFarm-Metadata"] = base64.b64encode(_build_payload(payload_prefix, None)).decode("ascii")
+            headers["X-Content-SHA256"] = cache_key[1]
+            blend_size = blend_path.stat().st_size
+            body = _ChunkedFileReader(
+                blend_path, lambda sent: log(f"Sent {sent >> 20} of {blend_size >> 20} MiB")
             )
-
-        log("Requesting upload URL from R-Farm service")
-        update_status("Requesting upload URL from R-Farm service")
-        gcs_uri: Optional[str] = None
-        blend_inline: Optional[str] = None
-
-        try:
-            upload_url, gcs_uri = _request_upload_url(endpoint, auth_token, blend_path)
-            log("Upload URL received, uploading .blend file")
-            upload_start = time.time()
+            # A compressed .blend would gain nothing from a second gzip pass.
+            if health.get("request_encoding") == "gzip" and not job_args.get("compressed"):
+                body = _gzip_chunks(body)
+                headers["Content-Encoding"] = "gzip"
+            return _service_urls(endpoint)["render_binary"], headers, body
+
+        def submit_render():
+            nonlocal render_start
+            url, headers, body = build_request()
+            log("Submitting render request to R-Farm service")
+            render_start = time.time()
             update_status(
-                "Uploading .blend file to R-farm",
-                timestamp=upload_start,
-                upload_start=upload_start,
+                "Waiting for response from R-Farm",
+                timestamp=render_start,
+                render_start=render_start,
             )
-            _upload_blend_to_gcs(upload_url, blend_path)
-            upload_end = time.time()
-            update_status("Upload complete", timestamp=upload_end, upload_end=upload_end)
-            upload_end_recorded = True
-            log("Blend file uploaded successfully")
-        except UploadURLNotSupported:
-            log("Service does not support upload URLs, embedding .blend file in request")
-            update_status("Embedding .blend file in request")
-            with open(blend_path, "rb") as handle:
-                blend_inline = base64.b64encode(handle.read()).decode("ascii")
-
-        payload = _build_payload(base_payload, gcs_uri, blend_inline)
-        url = endpoint.rstrip("/") + "/render"
-
-        headers = {"Content-Type": "application/json"}
-        if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
-
-        log("Submitting render request to R-Farm service")
-        render_start = time.time()
-        update_status(
-            "Waiting for response from R-Farm",
-            timestamp=render_start,
-            render_start=render_start,
-        )
-        response = requests_module.post(url, headers=headers, data=json.dumps(payload), timeout=300)
-        render_end = time.time()
-        update_status("Processing render result", timestamp=render_end, render_end=render_end)
-        render_end_recorded = True
-        log(f"Service responded with HTTP {response.status_code}")
-
-        if response.status_code >= 400:
-            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+            return session.post(url, headers=headers, data=body, timeout=300, stream=True)
 
+        reused_upload = bool(gcs_uri)
+        if reused_upload:
+            _UPLOAD_CACHE.move_to_end(cache_key)
+            log("Scene unchanged since the last upload, reusing uploaded .blend file")
+        else:
+            gcs_uri = upload_blend()
+            send_binary = gcs_uri is None
+
+        response = submit_render()
+        if reused_upload and response.status_code == 404:
+            # The cached object may have been removed from the bucket (a lifecycle
+            # rule or a new deployment); upload it again and retry once.
+            response.close()
+            _UPLOAD_CACHE.pop(cache_key, None)
+            log("Previously uploaded .blend file is no longer available, uploading it again")
+            gcs_uri = upload_blend()
+            send_binary = gcs_uri is None
+            response = submit_render()
         try:
-            payload_response = response.json()
-        except ValueError as exc:
-            raise RuntimeError("Invalid JSON response") from exc
-
-        job_id = payload_response.get("job_id", "")
-        image_base64 = payload_response.get("image_base64")
-        remote_format = payload_response.get("output_format", "PNG")
-
-        if not image_base64:
-            raise RuntimeError("Response missing image data")
+            render_end = time.time()
+            update_status("Processing render result", timestamp=render_end, render_end=render_end)
+            render_end_recorded = True
+            log(f"Service responded with HTTP {response.status_code}")
 
-        image_bytes = base64.b64decode(image_base64)
-        final_path: Optional[Path] = None
+            if response.status_code >= 400:
+                raise RuntimeError(f"HTTP {response.status_code}: {_short_body(response)}")
 
-        if output_path_str:
-            final_path = Path(output_path_str)
-            _ensure_output_directory(final_path)
-            final_path = _find_available_output_path(final_path)
-            with open(final_path, "wb") as out_file:
-                out_file.write(image_bytes)
-        else:
-            fallback_dir.mkdir(parents=True, exist_ok=True)
-            fallback_name = f"rfarm_frame.{remote_format.lower()}"
-            final_path = _find_available_output_path(fallback_dir / fallback_name)
-            with open(final_path, "wb") as out_file:
-                out_file.write(image_bytes)
+            content_type = response.headers.get("Content-Type", "")
+            if frames:
+                job_id, final_path, written, failed = _write_batch_results(
+                    response.iter_lines(DOWNLOAD_CHUNK_SIZE), frames, fallback_dir, log
+                )
+                if written + failed < len(frames):
+                    raise RuntimeError(
+                        f"Batch response ended after {written + failed} of {len(frames)} frames"
+                    )
+                if not written:
+                    raise RuntimeError(f"All {failed} frames failed to render")
+                log(f"Rendered {written} of {len(frames)} frames")
+            elif content_type.startswith("application/octet-stream"):
+                job_id = response.headers.get("X-RFarm-Job-Id", "")
+                remote_format = response.headers.get("X-RFarm-Output-Format", "PNG")
+                final_path = _resolve_final_path(output_path_str, fallback_dir, remote_format)
+                _write_chunks(final_path, response.iter_content(DOWNLOAD_CHUNK_SIZE))
+            else:
+                part_path = tmpdir / "result.part"
+                with open(part_path, "wb") as part_file:
+                    payload_response, has_image = _extract_base64_field(
+                        response.iter_content(DOWNLOAD_CHUNK_SIZE), "image_base64", part_file
+                    )
+                    part_file.flush()
+                    os.fsync(part_file.fileno())
+
+                job_id = payload_response.get("job_id", "")
+                remote_format = payload_response.get("output_format", "PNG")
+                output_url = payload_response.get("output_url")
+
+                if has_image:
+                    final_path = _resolve_final_path(output_path_str, fallback_dir, remote_format)
+                    shutil.move(str(part_path), str(final_path))
+                elif output_url:
+                    final_path = _resolve_final_path(output_path_str, fallback_dir, remote_format)
+                    log("Downloading render result")
+                    with session.get(output_url, timeout=300, stream=True) as download:
+                        if download.status_code >= 400:
+                            raise RuntimeError(f"Result download failed: HTTP {download.status_code}")
+                        _write_chunks(final_path, download.iter_content(DOWNLOAD_CHUNK_SIZE))
+                else:
+                    raise RuntimeError("Response missing image data")
+        finally:
+            response.close()
 
         folder_text = str(final_path.parent)
         log(f"Result saved to {folder_text} ({final_path.name})")
         update_status("Render completed")
 
-        job_queue.put(
-            (
-                "result",
-                time.time(),
-                {
-                    "status": "success",
-                    "job_id": job_id,
-                    "output_path": str(final_path),
-                },
-            )
+        emit(
+            "result",
+            time.time(),
+            {
+                "status": "success",
+                "job_id": job_id,
+                "output_path": str(final_path),
+            },
         )
     except Exception as exc:  # noqa: BLE001
+        if cache_key is not None:
+            # The cached object may have expired from the bucket; re-check next time.
+            _UPLOAD_CACHE.pop(cache_key, None)
         log(f"Error: {exc}")
         failure_timestamp = time.time()
         if upload_start is not None and not upload_end_recorded:
@@ -472,18 +1082,50 @@ def _run_remote_render_job(job_args: dict) -> None:
             update_status(timestamp=failure_timestamp, render_end=failure_timestamp)
             render_end_recorded = True
         update_status(f"Error: {exc}")
-        job_queue.put(
-            (
-                "result",
-                time.time(),
-                {
-                    "status": "error",
-                    "error": str(exc),
-                },
-            )
+        emit(
+            "result",
+            time.time(),
+            {
+                "status": "error",
+                "error": str(exc),
+            },
         )
     finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
+        if owns_files:
+            _cleanup_job_files(tmpdir, blend_path)
+
+
+_SUBMISSIONS: Optional[queue.Queue] = None
+_worker_thread: Optional[threading.Thread] = None
+
+
+def _worker_loop(submissions: queue.Queue) -> None:
+    """Run submitted jobs one at a time until the shutdown sentinel (None) arrives."""
+
+    while True:
+        job_args = submissions.get()
+        if job_args is None:
+            break
+        _run_remote_render_job(job_args)
+
+
+def _start_worker() -> None:
+    global _SUBMISSIONS, _worker_thread
+    if _worker_thread is not None and _worker_thread.is_alive():
+        return
+    _SUBMISSIONS = queue.Queue()
+    _worker_thread = threading.Thread(
+        target=_worker_loop, args=(_SUBMISSIONS,), name="rfarm-worker", daemon=True
+    )
+    _worker_thread.start()
+
+
+def _stop_worker() -> None:
+    global _SUBMISSIONS, _worker_thread
+    if _SUBMISSIONS is not None:
+        _SUBMISSIONS.put(None)
+    _SUBMISSIONS = None
+    _worker_thread = None
 
 
 def _schedule_status_popup() -> None:
@@ -533,19 +1175,24 @@ def _process_remote_job_queue(scene) -> bool:
     if not job_info:
         return False
 
-    job_queue: queue.Queue = job_info["queue"]
-    updated = False
-
+    job_events: deque = job_info["events"]
+    events = []
     while True:
         try:
-            kind, timestamp, payload = job_queue.get_nowait()
-        except queue.Empty:
+            events.append(job_events.popleft())
+        except IndexError:
             break
 
-        if kind == "log":
-            _append_log_entry(status, payload, timestamp)
-            updated = True
-        elif kind == "status":
+    if not events:
+        return False
+
+    STATUS_REVISIONS[scene_key] = STATUS_REVISIONS.get(scene_key, 0) + 1
+    logs = [(timestamp, payload) for kind, timestamp, payload in events if kind == "log"]
+    if logs:
+        _append_log_entries(status, logs)
+
+    for kind, timestamp, payload in events:
+        if kind == "status":
             message = payload.get("message")
             if message is not None:
                 status.current_status = message
@@ -569,8 +1216,6 @@ def _process_remote_job_queue(scene) -> bool:
                 status.render_time_seconds = max(
                     0.0, float(render_end) - status.render_start_timestamp
                 )
-
-            updated = True
         elif kind == "result":
             status.finish_timestamp = timestamp
             if payload.get("status") == "success":
@@ -582,13 +1227,12 @@ def _process_remote_job_queue(scene) -> bool:
                 status.last_output_path = ""
                 status.last_error = payload.get("error", "Unknown error")
             status.is_rendering = False
-            updated = True
             job_info["done"] = True
 
-    if job_info.get("done") and job_queue.empty():
+    if job_info.get("done") and not job_events:
         ACTIVE_RENDER_JOBS.pop(scene_key, None)
 
-    return updated
+    return True
 
 
 def _scene_from_pointer(pointer: int):
@@ -598,38 +1242,71 @@ def _scene_from_pointer(pointer: int):
     return None
 
 
-def _remote_job_timer_callback(scene_key: int):
+TIMER_MIN_INTERVAL = 0.05
+TIMER_MAX_INTERVAL = 1.0
+TIMER_BACKOFF = 1.5
+
+
+def _resolve_job_scene(scene_key: int, job_info: Optional[dict]):
+    """Return the job's scene, looked up afresh so undo or a file load cannot leave it stale.
+
+    A cached Python reference would keep reporting its old pointer after Blender
+    reallocates the scene, so the name is used for a direct lookup instead, with
+    the pointer confirming it is still the same scene.
+    """
+
+    if job_info:
+        scene = bpy.data.scenes.get(job_info.get("scene_name", ""))
+        if scene is not None and scene.as_pointer() == scene_key:
+            return scene
+
     scene = _scene_from_pointer(scene_key)
+    if job_info and scene is not None:
+        job_info["scene_name"] = scene.name
+    return scene
+
+
+def _remote_job_timer_callback(scene_key: int):
+    job_info = ACTIVE_RENDER_JOBS.get(scene_key)
+    scene = _resolve_job_scene(scene_key, job_info)
     if scene is None:
         ACTIVE_RENDER_JOBS.pop(scene_key, None)
         return None
 
-    _process_remote_job_queue(scene)
+    if job_info:
+        job_info["wake"].clear()
+
+    updated = _process_remote_job_queue(scene)
     job_info = ACTIVE_RENDER_JOBS.get(scene_key)
 
     if not job_info:
         return None
 
-    if job_info.get("done") and job_info["queue"].empty():
+    if job_info.get("done") and not job_info["events"]:
         return None
 
-    return 0.5
+    # Poll quickly while the worker is producing events and back off (with jitter)
+    # towards TIMER_MAX_INTERVAL while it is idle, e.g. during the remote render.
+    if updated or job_info["wake"].is_set():
+        interval = TIMER_MIN_INTERVAL
+    else:
+        interval = min(TIMER_MAX_INTERVAL, job_info.get("last_interval", TIMER_MIN_INTERVAL) * TIMER_BACKOFF)
+        interval *= 0.8 + 0.4 * random.random()
+    job_info["last_interval"] = interval
+    return interval
 
 
-class RFarm_OT_render_frame(Operator):
-    bl_idname = "rfarm.render_frame"
-    bl_label = "Render Current Frame on R-Farm"
-    bl_description = "Upload the current .blend and render the active frame on Cloud Run"
+class _RemoteRenderSubmitter:
+    """Shared submission logic for the single-frame and frame-range operators."""
 
-    def _resolve_output_path(self, scene) -> Optional[Path]:
+    def _resolve_output_path(self, scene, frame: int) -> Optional[Path]:
         render = scene.render
-        frame = scene.frame_current
         filepath = bpy.path.abspath(render.frame_path(frame=frame))
         if not filepath:
             return None
         return Path(filepath)
 
-    def execute(self, context):
+    def _submit(self, context, frames: Optional[dict] = None):
         scene = context.scene
         status = scene.rfarm_status
         prefs = context.preferences.addons[__name__].preferences
@@ -638,7 +1315,7 @@ class RFarm_OT_render_frame(Operator):
             self.report({"WARNING"}, "A remote render is already running.")
             return {"CANCELLED"}
 
-        if requests is None:
+        if not _requests_available():
             message = "Python module 'requests' is required. Install it in Blender's Python environment."
             status.last_error = message
             self.report({"ERROR"}, message)
@@ -654,59 +1331,83 @@ class RFarm_OT_render_frame(Operator):
             status.last_error = "Render engine must be Cycles"
             return {"CANCELLED"}
 
-        tmpdir = Path(tempfile.mkdtemp(prefix="rfarm_"))
+        scene_key = scene.as_pointer()
+        tmpdir = _job_scratch_dir(_scratch_root(), scene_key)
         blend_path = tmpdir / "scene.blend"
-        try:
-            bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), copy=True)
-        except RuntimeError as ex:
-            shutil.rmtree(tmpdir, ignore_errors=True)
-            status.last_error = str(ex)
-            self.report({"ERROR"}, f"Unable to export .blend: {ex}")
-            return {"CANCELLED"}
-
-        output_path = self._resolve_output_path(scene)
+        output_path = self._resolve_output_path(scene, scene.frame_current)
         fallback_dir = Path(bpy.app.tempdir or tempfile.gettempdir())
-        base_payload = _prepare_base_payload(scene)
-
-        status.is_rendering = True
-        status.last_error = ""
-        status.last_output_path = ""
-        status.last_job_id = ""
-        status.start_timestamp = time.time()
-        status.finish_timestamp = 0.0
-        status.current_status = "Preparing upload"
-        status.upload_time_seconds = 0.0
-        status.render_time_seconds = 0.0
-        status.upload_start_timestamp = 0.0
-        status.render_start_timestamp = 0.0
-        status.log_entries.clear()
-        status.log_index = 0
-        _append_log_entry(status, "Remote render job initialised")
-
-        job_queue: queue.Queue = queue.Queue()
-        scene_key = scene.as_pointer()
-        ACTIVE_RENDER_JOBS.pop(scene_key, None)
-        ACTIVE_RENDER_JOBS[scene_key] = {"queue": job_queue, "done": False}
+        _base_payload, payload_prefix = _prepare_base_payload(scene)
 
+        job_events: deque = deque()
+        blend_ready = threading.Event()
+        wake = threading.Event()
         job_args = {
-            "queue": job_queue,
+            "events": job_events,
+            "wake": wake,
             "endpoint": prefs.endpoint,
             "auth_token": prefs.auth_token,
             "blend_path": str(blend_path),
+            "blend_ready": blend_ready,
             "tmpdir": str(tmpdir),
-            "base_payload": base_payload,
+            "payload_prefix": payload_prefix,
+            "compressed": prefs.compress_uploads,
+            "frames": frames,
             "output_path": str(output_path) if output_path else "",
             "fallback_dir": str(fallback_dir),
-            "requests_module": requests,
+            "session": _get_session(),
         }
 
-        worker = threading.Thread(target=_run_remote_render_job, args=(job_args,), daemon=True)
-        job_info = ACTIVE_RENDER_JOBS[scene_key]
-        job_info["thread"] = worker
-        timer_callback = partial(_remote_job_timer_callback, scene_key)
-        job_info["timer_callback"] = timer_callback
-        bpy.app.timers.register(timer_callback, first_interval=0.5)
-        worker.start()
+        # Submit before saving so the worker can open the connection to the
+        # service while Blender is still writing the .blend file.
+        _start_worker()
+        _SUBMISSIONS.put(job_args)
+
+        # The worker waits for blend_ready before doing anything, so it must be set
+        # on every path out of here; blend_error tells it to drop the job.
+        try:
+            try:
+                bpy.ops.wm.save_as_mainfile(
+                    filepath=str(blend_path), copy=True, compress=prefs.compress_uploads
+                )
+            except RuntimeError as ex:
+                job_args["blend_error"] = str(ex)
+                status.last_error = str(ex)
+                self.report({"ERROR"}, f"Unable to export .blend: {ex}")
+                return {"CANCELLED"}
+
+            status.is_rendering = True
+            status.last_error = ""
+            status.last_output_path = ""
+            status.last_job_id = ""
+            status.start_timestamp = time.time()
+            status.finish_timestamp = 0.0
+            status.current_status = "Preparing upload"
+            status.upload_time_seconds = 0.0
+            status.render_time_seconds = 0.0
+            status.upload_start_timestamp = 0.0
+            status.render_start_timestamp = 0.0
+            _reset_log(status)
+            _append_log_entry(status, "Remote render job initialised")
+
+            ACTIVE_RENDER_JOBS.pop(scene_key, None)
+            ACTIVE_RENDER_JOBS[scene_key] = {
+                "events": job_events,
+                "wake": wake,
+                "done": False,
+            }
+
+            job_info = ACTIVE_RENDER_JOBS[scene_key]
+            job_info["scene_name"] = scene.name
+            timer_callback = partial(_remote_job_timer_callback, scene_key)
+            job_info["timer_callback"] = timer_callback
+            bpy.app.timers.register(timer_callback, first_interval=TIMER_MIN_INTERVAL)
+        except BaseException as ex:
+            job_args.setdefault("blend_error", str(ex) or type(ex).__name__)
+            ACTIVE_RENDER_JOBS.pop(scene_key, None)
+            status.is_rendering = False
+            raise
+        finally:
+            blend_ready.set()
 
         self.report({"INFO"}, "Remote render job submitted to R-Farm")
         _schedule_status_popup()
@@ -714,11 +1415,51 @@ class RFarm_OT_render_frame(Operator):
         return {"FINISHED"}
 
 
+class RFarm_OT_render_frame(_RemoteRenderSubmitter, Operator):
+    bl_idname = "rfarm.render_frame"
+    bl_label = "Render Current Frame on R-Farm"
+    bl_description = "Upload the current .blend and render the active frame on Cloud Run"
+
+    def execute(self, context):
+        return self._submit(context)
+
+
+class RFarm_OT_render_range(_RemoteRenderSubmitter, Operator):
+    bl_idname = "rfarm.render_range"
+    bl_label = "Render Frame Range on R-Farm"
+    bl_description = "Upload the current .blend once and render a range of frames in one request"
+
+    frame_start: IntProperty(name="Start Frame", default=1, min=0)
+    frame_end: IntProperty(name="End Frame", default=250, min=0)
+    frame_step: IntProperty(name="Step", default=1, min=1)
+
+    def invoke(self, context, _event):
+        scene = context.scene
+        self.frame_start = scene.frame_start
+        self.frame_end = scene.frame_end
+        self.frame_step = scene.frame_step
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if self.frame_end < self.frame_start:
+            self.report({"ERROR"}, "The end frame must not be before the start frame.")
+            return {"CANCELLED"}
+
+        scene = context.scene
+        frames = {}
+        for frame in range(self.frame_start, self.frame_end + 1, self.frame_step):
+            output_path = self._resolve_output_path(scene, frame)
+            frames[frame] = str(output_path) if output_path else ""
+        return self._submit(context, frames)
+
+
 class RFarm_OT_render_status_popup(Operator):
     bl_idname = "rfarm.render_status_popup"
     bl_label = "R-Farm Render Status"
 
     _timer = None
+    _seen_revision = -1
+    _seen_second = 0
 
     def invoke(self, context, _event):
         scene = context.scene
@@ -734,10 +1475,15 @@ class RFarm_OT_render_status_popup(Operator):
     def modal(self, context, event):
         if event.type == "TIMER":
             _process_remote_job_queue(context.scene)
-            if context.area:
-                context.area.tag_redraw()
-
             scene_key = context.scene.as_pointer()
+
+            # Redraw on new status events, and once per second for the elapsed clock.
+            revision = STATUS_REVISIONS.get(scene_key, 0)
+            second = int(time.time())
+            if context.area and (revision != self._seen_revision or second != self._seen_second):
+                context.area.tag_redraw()
+            self._seen_revision = revision
+            self._seen_second = second
             status = context.scene.rfarm_status
             job_active = scene_key in ACTIVE_RENDER_JOBS and ACTIVE_RENDER_JOBS[scene_key].get("done") is not True
 
@@ -794,18 +1540,23 @@ classes = (
     RFarm_UL_status_log,
     RFarm_PT_panel,
     RFarm_OT_render_frame,
+    RFarm_OT_render_range,
     RFarm_OT_render_status_popup,
 )
 
 
+_register_classes, _unregister_classes = register_classes_factory(classes)
+
+
 def register():
     ACTIVE_RENDER_JOBS.clear()
-    for cls in classes:
-        register_class(cls)
+    _register_classes()
     bpy.types.Scene.rfarm_status = PointerProperty(type=RFarmStatus)
+    _start_worker()
 
 
 def unregister():
+    global _session
     for job in list(ACTIVE_RENDER_JOBS.values()):
         callback = job.get("timer_callback")
         if callback:
@@ -814,8 +1565,18 @@ def unregister():
             except ValueError:
                 pass
     ACTIVE_RENDER_JOBS.clear()
-    for cls in reversed(classes):
-        unregister_class(cls)
+    _stop_worker()
+    STATUS_REVISIONS.clear()
+    _LOGS_BY_SCENE.clear()
+    _LOG_VERSIONS.clear()
+    _PAYLOAD_CACHE.clear()
+    _UPLOAD_CACHE.clear()
+    _URL_CACHE.clear()
+    _remove_session_tmpdirs()
+    if _session is not None:
+        _session.close()
+        _session = None
+    _unregister_classes()
     if hasattr(bpy.types.Scene, "rfarm_status"):
         del bpy.types.Scene.rfarm_status
 
@@ -2,44 +2,103 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import hashlib
 import json
+import logging
 import os
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import uuid
+import zlib
+from collections import OrderedDict, deque
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 from urllib.error import URLError
 from urllib.request import Request as UrlRequest, urlopen
 
-from fastapi import FastAPI, HTTPException
-from google.api_core import exceptions as gcs_exceptions
-from google.cloud import storage
-from pydantic import BaseModel, Field
+import orjson
+import pybase64
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from starlette.background import BackgroundTask
 
-import google.auth
-from google.auth import exceptions as google_auth_exceptions
-from google.auth import impersonated_credentials
-from google.auth import credentials as google_auth_credentials
-from google.auth.transport.requests import Request as GoogleAuthRequest
+# The Google client libraries are slow to import, so they are loaded on first use
+# to keep them out of container start-up.
+if TYPE_CHECKING:
+    from google.auth import credentials as google_auth_credentials
+    from google.cloud import storage
 
 APP_ROOT = Path(__file__).resolve().parent
 BLENDER_EXECUTABLE = os.environ.get("BLENDER_EXECUTABLE", "blender")
 RENDER_SCRIPT = APP_ROOT / "render_worker.py"
+# Resolved once so each launch skips the PATH search and Path-to-str conversion.
+_BLENDER_PATH = shutil.which(BLENDER_EXECUTABLE) or BLENDER_EXECUTABLE
+_RENDER_SCRIPT_STR = os.fspath(RENDER_SCRIPT)
+_SERVE_COMMAND = (_BLENDER_PATH, "--background", "--python", _RENDER_SCRIPT_STR, "--", "--serve")
+# Must match render_worker.RESULT_MARKER; the worker prefixes its result line with it.
+RESULT_MARKER = "__RFARM_RESULT__"
+_RESULT_MARKER_BYTES = RESULT_MARKER.encode("ascii")
+# Only the last lines of Blender's output are kept for error details and the response.
+LOG_TAIL_LINES = 4096
 GCS_BUCKET = os.environ.get("RFARM_GCS_BUCKET")
 SIGNED_URL_TTL_MINUTES = int(os.environ.get("RFARM_SIGNED_URL_TTL_MINUTES", "15"))
+RESULTS_TO_GCS = os.environ.get("RFARM_RESULTS_TO_GCS", "").lower() in ("1", "true", "yes")
+# A render that produces no result within this time is killed and reported as failed.
+RENDER_TIMEOUT_SECONDS = float(os.environ.get("RFARM_RENDER_TIMEOUT_SECONDS", "3600"))
+PERSISTENT_BLENDER = os.environ.get("RFARM_PERSISTENT_BLENDER", "1").lower() not in ("0", "false", "no")
+# Compressed request bodies are only accepted where the body is streamed to disk.
+GZIP_REQUEST_PATHS = frozenset({"/render-binary"})
+MAX_INFLATED_BODY_BYTES = int(os.environ.get("RFARM_MAX_INFLATED_BODY_BYTES", str(4 << 30)))
+INFLATE_CHUNK_SIZE = 1 << 20
+RENDER_SLOTS = int(os.environ.get("RFARM_RENDER_SLOTS", "4"))
+SLOT_ROOT = Path(tempfile.gettempdir())
+# Every job slot holds the render output in this subdirectory, under a fixed basename.
+SLOT_OUTPUT_DIR = "output"
+OUTPUT_BASENAME = "frame"
+MAX_BATCH_FRAMES = int(os.environ.get("RFARM_MAX_BATCH_FRAMES", "1000"))
+SHA256_HEX = re.compile(r"^[0-9a-f]{64}$")
+# Objects named after a client-reported digest; reused only once the server has checked it.
+CONTENT_ADDRESSED_BLOB = re.compile(r"^uploads/sha256/([0-9a-f]{64})/")
+VERIFIED_SHA256_METADATA_KEY = "rfarm-verified-sha256"
+# Blends at least this large are fetched as parallel byte ranges of this size.
+GCS_PARALLEL_CHUNK_SIZE = 32 << 20
+GCS_PARALLEL_WORKERS = 8
+RESULTS_DIR = SLOT_ROOT / "rfarm_results"
+RESULT_RETENTION_SECONDS = int(os.environ.get("RFARM_RESULT_RETENTION_SECONDS", "600"))
+RESULT_RETENTION_LIMIT = int(os.environ.get("RFARM_RESULT_RETENTION_LIMIT", "64"))
+# Opt-in: each pooled URL costs a signing call, and the add-on always sends a digest.
+UPLOAD_URL_POOL_SIZE = int(os.environ.get("RFARM_UPLOAD_URL_POOL_SIZE", "0"))
+UPLOAD_URL_POOL_REFILL_SECONDS = 5
+UPLOAD_URL_POOL_MAX_BACKOFF_SECONDS = 300
+# Pooled upload URLs are only handed out while half of their lifetime remains.
+UPLOAD_URL_MIN_REMAINING_SECONDS = SIGNED_URL_TTL_MINUTES * 60 / 2
+DEFAULT_BLEND_FILENAME = "scene.blend"
 
 _storage_client: Optional[storage.Client] = None
+_slot_pool: Optional[asyncio.Queue] = None
+# job_id -> (image path, output format, expiry on the monotonic clock), oldest first.
+_retained_results: "OrderedDict[str, Tuple[Path, str, float]]" = OrderedDict()
+# Pre-signed (object name, upload URL, expiry on the monotonic clock), oldest first.
+_upload_url_pool: Deque[Tuple[str, str, float]] = deque()
+_upload_url_pool_task: Optional[asyncio.Task] = None
 _service_account_email: Optional[str] = None
 _signing_credentials: Optional[google_auth_credentials.Signing] = None
 
+logger = logging.getLogger("rfarm.worker")
+
 app = FastAPI(title="R-Farm Render Worker", version="0.1.0")
 
 
 class RenderSettings(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     resolution_x: Optional[int] = None
     resolution_y: Optional[int] = None
     resolution_percentage: Optional[int] = Field(default=None, ge=1, le=100)
@@ -54,10 +113,9 @@ class RenderSettings(BaseModel):
 
 
 class RenderRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     frame: int = Field(description="Frame number to render")
-    blend_file: Optional[str] = Field(
-        default=None, description="Base64 encoded .blend content (legacy mode)",
-    )
     blend_gcs_uri: Optional[str] = Field(
         default=None,
         description="gs:// URI pointing at the .blend file uploaded to Cloud Storage",
@@ -67,36 +125,141 @@ class RenderRequest(BaseModel):
     compute_device_type: str = Field(default="OPTIX", description="Cycles compute device")
 
 
+class BatchRenderRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    frames: List[int] = Field(
+        min_length=1, max_length=MAX_BATCH_FRAMES, description="Frame numbers to render, in order",
+    )
+    blend_gcs_uri: str = Field(
+        description="gs:// URI pointing at the .blend file uploaded to Cloud Storage",
+    )
+    render_settings: RenderSettings = Field(default_factory=RenderSettings)
+    device: str = Field(default="GPU", description="Either GPU or CPU")
+    compute_device_type: str = Field(default="OPTIX", description="Cycles compute device")
+
+
 class RenderResponse(BaseModel):
     job_id: str
-    image_base64: str
+    image_base64: Optional[str] = None
+    output_url: Optional[str] = Field(
+        default=None,
+        description="Signed Cloud Storage URL of the result when results are delivered via GCS",
+    )
+    image_url: Optional[str] = Field(
+        default=None,
+        description="Path of the endpoint serving the image when it is not returned inline",
+    )
     output_format: str
     output_path: str
     logs: Optional[str] = None
 
 
 class BlendUploadRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     filename: str = Field(
-        default="scene.blend",
+        default=DEFAULT_BLEND_FILENAME,
         description="Name of the .blend file used to compose the Cloud Storage object",
     )
+    sha256: Optional[str] = Field(
+        default=None,
+        pattern=r"^[0-9a-f]{64}$",
+        description="Hex SHA-256 digest of the .blend file, used to skip duplicate uploads",
+    )
 
 
 class BlendUploadResponse(BaseModel):
-    upload_url: str
+    upload_url: Optional[str] = None
     blob_name: str
     gcs_uri: str
     expires_in: int = Field(description="Validity of the signed URL in seconds")
+    already_uploaded: bool = Field(
+        default=False,
+        description="True when an object with the same digest exists and no upload is needed",
+    )
+
+
+class GzipRequestMiddleware:
+    """Inflate ``/render-binary`` bodies sent with ``Content-Encoding: gzip``.
+
+    Bodies are decompressed chunk by chunk as they are received, so large uploads
+    never have to be buffered in compressed form. Output is produced in bounded
+    pieces and capped at ``MAX_INFLATED_BODY_BYTES`` so a small compressed body
+    cannot expand into an unbounded one. Other routes buffer their whole body, so
+    they do not accept compressed requests.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = scope["headers"]
+        if not any(name == b"content-encoding" and value.strip().lower() == b"gzip" for name, value in headers):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] not in GZIP_REQUEST_PATHS:
+            response = JSONResponse(
+                {"detail": "Content-Encoding: gzip is only accepted by /render-binary"}, status_code=415
+            )
+            await response(scope, receive, send)
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in headers if name not in (b"content-encoding", b"content-length")
+        ]
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pending = b""
+        more_body = True
+        finished = False
+        inflated = 0
+
+        async def inflating_receive():
+            nonlocal pending, more_body, finished, inflated
+            if finished:
+                return await receive()
+            while True:
+                if not pending:
+                    message = await receive()
+                    if message["type"] != "http.request":
+                        return message
+                    more_body = message.get("more_body", False)
+                    pending = message.get("body", b"")
+                body = decompressor.decompress(pending, INFLATE_CHUNK_SIZE)
+                pending = decompressor.unconsumed_tail
+                finished = not pending and not more_body
+                if finished:
+                    body += decompressor.flush()
+                inflated += len(body)
+                if inflated > MAX_INFLATED_BODY_BYTES:
+                    raise HTTPException(status_code=413, detail="Inflated request body is too large")
+                if finished and not decompressor.eof:
+                    raise HTTPException(status_code=400, detail="Truncated gzip request body")
+                if body or finished:
+                    return {"type": "http.request", "body": body, "more_body": not finished}
+
+        await self.app(scope, inflating_receive, send)
+
+
+app.add_middleware(GzipRequestMiddleware)
 
 
 @app.get("/healthz")
 def healthcheck() -> Dict[str, str]:
-    return {"status": "ok"}
+    return {"status": "ok", "request_encoding": "gzip"}
 
 
 def _get_storage_client() -> storage.Client:
     global _storage_client
     if _storage_client is None:
+        from google.cloud import storage
+
         _storage_client = storage.Client()
     return _storage_client
 
@@ -113,6 +276,9 @@ def _get_service_account_email() -> Optional[str]:
         _service_account_email = env_email
         return _service_account_email
 
+    import google.auth
+    from google.auth import exceptions as google_auth_exceptions
+
     try:
         credentials, _ = google.auth.default()
     except google_auth_exceptions.DefaultCredentialsError:
@@ -145,6 +311,12 @@ def _get_signing_credentials(service_account_email: str) -> google_auth_credenti
     if _signing_credentials:
         return _signing_credentials
 
+    import google.auth
+    from google.auth import credentials as google_auth_credentials
+    from google.auth import exceptions as google_auth_exceptions
+    from google.auth import impersonated_credentials
+    from google.auth.transport.requests import Request as GoogleAuthRequest
+
     try:
         base_credentials, _ = google.auth.default()
     except google_auth_exceptions.GoogleAuthError as exc:
@@ -176,11 +348,125 @@ def _get_signing_credentials(service_account_email: str) -> google_auth_credenti
     return _signing_credentials
 
 
-def _write_blend_file(tmp_dir: Path, blend_data: str) -> Path:
-    blend_path = tmp_dir / "scene.blend"
-    with open(blend_path, "wb") as handle:
-        handle.write(base64.b64decode(blend_data))
-    return blend_path
+def _warm_up_google_clients() -> None:
+    """Create the storage client and signing credentials before the first request needs them.
+
+    Failures are ignored here; the request that needs the client retries and reports them.
+    """
+
+    if not GCS_BUCKET:
+        return
+    try:
+        _get_storage_client()
+        service_account_email = _get_service_account_email()
+        if service_account_email:
+            _get_signing_credentials(service_account_email)
+    except Exception:  # noqa: BLE001 - best effort, see docstring
+        pass
+
+
+async def _start_warm_up() -> None:
+    # Run in the background so the warm-up does not delay the container becoming ready.
+    asyncio.get_running_loop().run_in_executor(None, _warm_up_google_clients)
+
+
+app.add_event_handler("startup", _start_warm_up)
+
+
+def _clear_slot_dir(path: Path) -> None:
+    """Remove the files a job left behind, keeping the directory layout for reuse."""
+
+    for entry in os.scandir(path):
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                _clear_slot_dir(Path(entry.path))
+            else:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+class _JobSlot:
+    """A pooled job directory that is emptied and returned to the pool on ``release``.
+
+    ``release`` is idempotent and may run on a worker thread, because file and batch
+    responses finish after the request handler has returned.
+    """
+
+    def __init__(self, path: Path, pool: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+        self.path = path
+        self._pool = pool
+        self._loop = loop
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        _clear_slot_dir(self.path)
+        self._loop.call_soon_threadsafe(self._pool.put_nowait, self.path)
+
+
+def _get_slot_pool() -> asyncio.Queue:
+    global _slot_pool
+    if _slot_pool is None:
+        _slot_pool = asyncio.Queue()
+        for index in range(RENDER_SLOTS):
+            slot_path = SLOT_ROOT / f"rfarm_slot_{index}"
+            (slot_path / SLOT_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+            _clear_slot_dir(slot_path)
+            _slot_pool.put_nowait(slot_path)
+    return _slot_pool
+
+
+async def _acquire_slot() -> _JobSlot:
+    """Wait for a free job directory; this also bounds the number of concurrent jobs."""
+
+    pool = _get_slot_pool()
+    path = await pool.get()
+    return _JobSlot(path, pool, asyncio.get_running_loop())
+
+
+def _sign_blob_url(
+    blob: storage.Blob, method: str, expiration: timedelta, content_type: Optional[str] = None
+) -> str:
+    service_account_email = _get_service_account_email()
+    if not service_account_email:
+        raise HTTPException(
+            status_code=500,
+            detail="Unable to determine service account email for signing Cloud Storage URLs.",
+        )
+
+    signing_credentials = _get_signing_credentials(service_account_email)
+    return blob.generate_signed_url(
+        version="v4",
+        expiration=expiration,
+        method=method,
+        content_type=content_type,
+        service_account_email=service_account_email,
+        credentials=signing_credentials,
+    )
+
+
+def _upload_result_to_gcs(job_id: str, output_path: Path) -> str:
+    """Store a rendered frame in the bucket and return a signed download URL for it.
+
+    The client then fetches the image straight from Cloud Storage instead of
+    through the Cloud Run response.
+    """
+
+    from google.api_core import exceptions as gcs_exceptions
+
+    object_name = f"results/{job_id}/{output_path.name}"
+    try:
+        client = _get_storage_client()
+        blob = client.bucket(GCS_BUCKET).blob(object_name)
+        blob.upload_from_filename(str(output_path), content_type="application/octet-stream")
+        return _sign_blob_url(blob, "GET", timedelta(minutes=SIGNED_URL_TTL_MINUTES))
+    except gcs_exceptions.GoogleAPIError as exc:
+        raise HTTPException(status_code=502, detail=f"Failed to upload render result: {exc}") from exc
 
 
 def _parse_gcs_uri(gcs_uri: str) -> Tuple[str, str]:
@@ -196,14 +482,84 @@ def _parse_gcs_uri(gcs_uri: str) -> Tuple[str, str]:
     return bucket_name, blob_name
 
 
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    buffer = bytearray(1 << 20)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as handle:
+        while True:
+            read = handle.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def _verify_content_addressed_blob(blob: storage.Blob, local_path: Path) -> None:
+    """Check a digest-named upload against its content before it can be deduplicated.
+
+    The name comes from the digest the client reported. A mismatching object is
+    deleted so it cannot be handed out to later uploads of that digest, and a
+    matching one is marked verified in its metadata for ``/upload-url``. Either
+    write is skipped if the object was replaced by a newer upload meanwhile.
+    """
+
+    from google.api_core import exceptions as gcs_exceptions
+
+    stale = (gcs_exceptions.NotFound, gcs_exceptions.PreconditionFailed)
+    match = CONTENT_ADDRESSED_BLOB.match(blob.name)
+    if not match:
+        return
+    claimed = match.group(1)
+    metadata = blob.metadata or {}
+    if metadata.get(VERIFIED_SHA256_METADATA_KEY) == claimed:
+        return
+    if _sha256_file(local_path) != claimed:
+        try:
+            blob.delete(if_generation_match=blob.generation)
+        except stale:
+            pass
+        raise HTTPException(
+            status_code=400,
+            detail="Uploaded blend file does not match its SHA-256 digest; upload it again",
+        )
+    blob.metadata = {**metadata, VERIFIED_SHA256_METADATA_KEY: claimed}
+    try:
+        blob.patch(if_generation_match=blob.generation)
+    except stale:
+        pass
+
+
 def _download_blend_from_gcs(tmp_dir: Path, gcs_uri: str) -> Path:
+    """Download a blend into ``tmp_dir``, splitting large files into concurrent range requests.
+
+    One stream is limited by a single connection's throughput; smaller files are not
+    worth the extra requests.
+    """
+
+    from google.api_core import exceptions as gcs_exceptions
+    from google.cloud.storage import transfer_manager
+
     bucket_name, blob_name = _parse_gcs_uri(gcs_uri)
+    destination = tmp_dir / "scene.blend"
     try:
         client = _get_storage_client()
         bucket = client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-        destination = tmp_dir / "scene.blend"
-        blob.download_to_filename(destination)
+        blob = bucket.get_blob(blob_name)
+        if blob is None:
+            raise HTTPException(status_code=404, detail=f"Blend file not found: {gcs_uri}")
+        if blob.size is not None and blob.size >= GCS_PARALLEL_CHUNK_SIZE:
+            transfer_manager.download_chunks_concurrently(
+                blob,
+                str(destination),
+                chunk_size=GCS_PARALLEL_CHUNK_SIZE,
+                worker_type=transfer_manager.THREAD,
+                max_workers=GCS_PARALLEL_WORKERS,
+            )
+        else:
+            with open(destination, "wb") as handle:
+                blob.download_to_file(handle)
+        _verify_content_addressed_blob(blob, destination)
     except gcs_exceptions.GoogleAPIError as exc:
         raise HTTPException(status_code=502, detail=f"Failed to download blend file: {exc}") from exc
     if not destination.exists():
@@ -211,10 +567,161 @@ def _download_blend_from_gcs(tmp_dir: Path, gcs_uri: str) -> Path:
     return destination
 
 
+class _PersistentBlender:
+    """A long-lived Blender process that renders one frame per JSON command on stdin.
+
+    Start-up, Cycles device enumeration and kernel loading are paid once per
+    container instead of once per frame. Commands are serialised with a lock, and
+    the process is restarted on the next render if it exits. A render that runs
+    past ``RENDER_TIMEOUT_SECONDS`` kills the process so it cannot hold the lock.
+    """
+
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                _SERVE_COMMAND,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        return self._process
+
+    def render(self, blend_path: Path, script_args: List[str]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Return the worker's result event (None if the process died) and its log output."""
+
+        with self._lock:
+            process = self._ensure_started()
+            lines: Deque[bytes] = deque(maxlen=LOG_TAIL_LINES)
+            try:
+                command = {"blend_path": os.fspath(blend_path), "argv": script_args}
+                process.stdin.write(orjson.dumps(command) + b"\n")
+                process.stdin.flush()
+            except (OSError, ValueError):
+                self._process = None
+                return None, ""
+
+            timed_out = threading.Event()
+
+            def kill_hung_render() -> None:
+                timed_out.set()
+                process.kill()
+
+            # Killing the process closes its stdout, which ends the read loop below.
+            watchdog = threading.Timer(RENDER_TIMEOUT_SECONDS, kill_hung_render)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                for line in process.stdout:
+                    lines.append(line)
+                    if not line.startswith(_RESULT_MARKER_BYTES):
+                        continue
+                    try:
+                        payload = json.loads(line[len(_RESULT_MARKER_BYTES) :])
+                    except ValueError:
+                        continue
+                    if payload.get("event") in ("render_done", "render_failed"):
+                        return payload, _decode_log(lines)
+            finally:
+                watchdog.cancel()
+
+            process.wait()
+            self._process = None
+            if timed_out.is_set():
+                raise HTTPException(
+                    status_code=504,
+                    detail=f"Render timed out after {RENDER_TIMEOUT_SECONDS:g}s: {_decode_log(lines)[-2000:]}",
+                )
+            return None, _decode_log(lines)
+
+    def close(self) -> None:
+        """Stop the process without taking the lock, so a hung render cannot block shutdown."""
+
+        process = self._process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+_blender_worker = _PersistentBlender()
+
+
+async def _close_blender_worker() -> None:
+    # close() may wait for Blender to exit; keep that off the event loop.
+    await asyncio.to_thread(_blender_worker.close)
+
+
+app.add_event_handler("shutdown", _close_blender_worker)
+
+
+def _decode_log(lines: Iterable[bytes]) -> str:
+    # Only the kept tail is decoded; Blender output is not guaranteed to be valid UTF-8.
+    return b"".join(lines).decode("utf-8", "replace")
+
+
+def _run_blender_once(blend_path: Path, script_args: List[str]) -> Tuple[str, Optional[Path]]:
+    """Render in a fresh Blender process; used when the persistent worker is disabled."""
+
+    command = [
+        _BLENDER_PATH,
+        "--background",
+        os.fspath(blend_path),
+        "--python",
+        _RENDER_SCRIPT_STR,
+        "--",
+        *script_args,
+    ]
+
+    # Stream the output instead of capturing it whole; verbose renders log a lot.
+    tail: Deque[bytes] = deque(maxlen=LOG_TAIL_LINES)
+    result_line: Optional[bytes] = None
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:
+        for line in process.stdout:
+            tail.append(line)
+            if line.startswith(_RESULT_MARKER_BYTES):
+                result_line = line[len(_RESULT_MARKER_BYTES) :]
+
+    logs = _decode_log(tail)
+    if process.returncode != 0:
+        raise HTTPException(status_code=500, detail=f"Blender failed: {logs[-2000:]}")
+
+    if result_line is None:
+        return logs, None
+    try:
+        payload = json.loads(result_line)
+    except ValueError:
+        return logs, None
+    output_path = payload.get("output_path")
+    return logs, Path(output_path) if output_path else None
+
+
+# (render_worker.py flag, RenderSettings field, value formatter) for optional settings.
+_SETTING_ARGS = (
+    ("--samples", "samples", str),
+    ("--resolution-x", "resolution_x", str),
+    ("--resolution-y", "resolution_y", str),
+    ("--resolution-percentage", "resolution_percentage", str),
+    ("--file-format", "file_format", str),
+    ("--color-mode", "color_mode", str),
+    ("--color-depth", "color_depth", str),
+    ("--use-adaptive-sampling", "use_adaptive_sampling", lambda value: str(int(value))),
+)
+
+
 def _run_blender(blend_path: Path, request: RenderRequest) -> Dict[str, Any]:
-    output_dir = blend_path.parent / "output"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_basename = "frame"
+    # The job slot was created with its output directory, and releasing it empties it.
+    output_dir = blend_path.parent / SLOT_OUTPUT_DIR
+    output_basename = OUTPUT_BASENAME
     script_args = [
         "--frame",
         str(request.frame),
@@ -229,53 +736,22 @@ def _run_blender(blend_path: Path, request: RenderRequest) -> Dict[str, Any]:
     ]
 
     settings = request.render_settings
-    if settings.samples is not None:
-        script_args.extend(["--samples", str(settings.samples)])
-    if settings.resolution_x is not None:
-        script_args.extend(["--resolution-x", str(settings.resolution_x)])
-    if settings.resolution_y is not None:
-        script_args.extend(["--resolution-y", str(settings.resolution_y)])
-    if settings.resolution_percentage is not None:
-        script_args.extend(["--resolution-percentage", str(settings.resolution_percentage)])
-    if settings.file_format is not None:
-        script_args.extend(["--file-format", settings.file_format])
-    if settings.color_mode is not None:
-        script_args.extend(["--color-mode", settings.color_mode])
-    if settings.color_depth is not None:
-        script_args.extend(["--color-depth", settings.color_depth])
-    if settings.use_adaptive_sampling is not None:
-        script_args.extend(["--use-adaptive-sampling", str(int(settings.use_adaptive_sampling))])
-
-    command = [
-        BLENDER_EXECUTABLE,
-        "--background",
-        str(blend_path),
-        "--python",
-        str(RENDER_SCRIPT),
-        "--",
-    ] + script_args
-
-    result = subprocess.run(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        check=False,
-    )
+    for flag, field_name, format_value in _SETTING_ARGS:
+        value = getattr(settings, field_name)
+        if value is not None:
+            script_args += (flag, format_value(value))
 
-    logs = result.stdout
-    if result.returncode != 0:
-        raise HTTPException(status_code=500, detail=f"Blender failed: {logs[-2000:]}")
-
-    output_path: Optional[Path] = None
-    for line in logs.splitlines():
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if "output_path" in payload:
-            output_path = Path(payload["output_path"])
-            break
+    if PERSISTENT_BLENDER:
+        payload, logs = _blender_worker.render(blend_path, script_args)
+        if payload is None:
+            raise HTTPException(status_code=500, detail=f"Blender worker exited: {logs[-2000:]}")
+        if payload.get("event") == "render_failed":
+            raise HTTPException(
+                status_code=500, detail=f"Blender failed: {payload.get('error')}\n{logs[-2000:]}"
+            )
+        output_path = Path(payload["output_path"]) if payload.get("output_path") else None
+    else:
+        logs, output_path = _run_blender_once(blend_path, script_args)
 
     if (not output_path or not output_path.exists()) and output_dir.exists():
         # Blender should always emit a JSON payload with the rendered file path, but in
@@ -291,77 +767,365 @@ def _run_blender(blend_path: Path, request: RenderRequest) -> Dict[str, Any]:
     if not output_path or not output_path.exists():
         raise HTTPException(status_code=500, detail="Render worker did not produce output")
 
-    encoded = base64.b64encode(output_path.read_bytes()).decode("ascii")
     return {
         "output_path": str(output_path),
-        "image_base64": encoded,
         "logs": logs,
     }
 
 
-@app.post("/render", response_model=RenderResponse)
-async def render_endpoint(request: RenderRequest) -> RenderResponse:
+def _accepts_binary(accept: Optional[str]) -> bool:
+    """Return True when the client prefers raw image bytes over the JSON response."""
+
+    if not accept:
+        return False
+    weights: Dict[str, float] = {}
+    for part in accept.split(","):
+        media_type, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[media_type.strip().lower()] = quality
+    binary = weights.get("application/octet-stream", 0.0)
+    return binary > 0 and binary >= weights.get("application/json", 0.0)
+
+
+def _output_format(output_path: Path, settings: RenderSettings) -> str:
+    return output_path.suffix.lstrip(".").upper() or settings.file_format or "PNG"
+
+
+def _evict_retained_results() -> None:
+    now = time.monotonic()
+    while _retained_results:
+        job_id, (path, _, expires_at) = next(iter(_retained_results.items()))
+        if expires_at > now and len(_retained_results) <= RESULT_RETENTION_LIMIT:
+            break
+        del _retained_results[job_id]
+        path.unlink(missing_ok=True)
+
+
+def _retain_result(job_id: str, output_path: Path, output_format: str) -> None:
+    """Move a rendered image out of its job slot so ``/render/{job_id}/image`` can serve it."""
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    retained_path = RESULTS_DIR / f"{job_id}{output_path.suffix}"
+    os.replace(output_path, retained_path)
+    _retained_results[job_id] = (
+        retained_path,
+        output_format,
+        time.monotonic() + RESULT_RETENTION_SECONDS,
+    )
+    _evict_retained_results()
+
+
+def _render_json(
+    job_id: str, output_format: str, output_path: Path, logs: str, **image: str
+) -> ORJSONResponse:
+    """Build a ``RenderResponse`` body as a ready response.
+
+    Returning a response object skips FastAPI's re-validation and serialisation of
+    the model, which would scan a large ``image_base64`` string again.
+    """
+
+    body: Dict[str, Optional[str]] = {
+        "job_id": job_id,
+        "image_base64": None,
+        "output_url": None,
+        "image_url": None,
+        "output_format": output_format,
+        "output_path": str(output_path),
+        "logs": logs,
+    }
+    body.update(image)
+    return ORJSONResponse(body)
+
+
+async def _render_response(
+    job_id: str,
+    blend_path: Path,
+    request: RenderRequest,
+    binary: bool,
+    inline: bool,
+    slot: _JobSlot,
+) -> Union[ORJSONResponse, FileResponse]:
+    """Render ``blend_path`` and return the image as JSON or, if ``binary``, raw bytes.
+
+    With ``RFARM_RESULTS_TO_GCS`` enabled the image is stored in the bucket and only
+    a signed ``output_url`` is returned. Without ``inline`` the JSON carries an
+    ``image_url`` instead of base64, and the image is kept for a while to be fetched
+    from there. A binary response streams the file after the handler returns, so it
+    takes over releasing the job slot once it is sent. The render and Cloud Storage
+    calls block, so they run in worker threads to keep the event loop free for
+    other requests.
+    """
+
+    result = await asyncio.to_thread(_run_blender, blend_path, request)
+    output_path = Path(result["output_path"])
+    output_format = _output_format(output_path, request.render_settings)
+    if RESULTS_TO_GCS and GCS_BUCKET:
+        output_url = await asyncio.to_thread(_upload_result_to_gcs, job_id, output_path)
+        return _render_json(job_id, output_format, output_path, result["logs"], output_url=output_url)
+    if binary:
+        # The scene is no longer needed; free its disk space while the image is sent.
+        blend_path.unlink(missing_ok=True)
+        return FileResponse(
+            output_path,
+            media_type="application/octet-stream",
+            headers={"X-RFarm-Job-Id": job_id, "X-RFarm-Output-Format": output_format},
+            background=BackgroundTask(slot.release),
+        )
+    if not inline:
+        _retain_result(job_id, output_path, output_format)
+        return _render_json(
+            job_id, output_format, output_path, result["logs"], image_url=f"/render/{job_id}/image"
+        )
+    image_bytes = await asyncio.to_thread(output_path.read_bytes)
+    return _render_json(
+        job_id,
+        output_format,
+        output_path,
+        result["logs"],
+        image_base64=pybase64.b64encode(image_bytes).decode("ascii"),
+    )
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _parse_json_model(model: Type[_ModelT], raw: bytes, invalid_detail: str) -> _ModelT:
+    try:
+        # Parse and validate in one pass in pydantic-core, without an intermediate dict.
+        return model.model_validate_json(raw)
+    except ValidationError as exc:
+        if any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise HTTPException(status_code=400, detail=invalid_detail) from exc
+        raise HTTPException(status_code=422, detail=exc.errors()) from exc
+
+
+def _json_request_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI ``requestBody`` for a model parsed by a dependency instead of by FastAPI."""
+
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {"required": True, "content": {"application/json": {"schema": inline(schema)}}}
+
+
+async def _render_request_body(raw_request: Request) -> RenderRequest:
+    return _parse_json_model(RenderRequest, await raw_request.body(), "Invalid JSON body")
+
+
+async def _batch_render_request_body(raw_request: Request) -> BatchRenderRequest:
+    return _parse_json_model(BatchRenderRequest, await raw_request.body(), "Invalid JSON body")
+
+
+def _parse_metadata_header(raw_request: Request) -> RenderRequest:
+    header = raw_request.headers.get("x-rfarm-metadata")
+    if not header:
+        raise HTTPException(status_code=400, detail="Missing X-RFarm-Metadata header")
+    try:
+        metadata = pybase64.b64decode(header, validate=True)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid X-RFarm-Metadata header") from exc
+    return _parse_json_model(RenderRequest, metadata, "Invalid X-RFarm-Metadata header")
+
+
+@app.post(
+    "/render",
+    response_model=RenderResponse,
+    openapi_extra={"requestBody": _json_request_body_schema(RenderRequest)},
+)
+async def render_endpoint(
+    request: RenderRequest = Depends(_render_request_body),
+    accept: Optional[str] = Header(default=None),
+    inline: bool = True,
+) -> Union[ORJSONResponse, FileResponse]:
+    if not request.blend_gcs_uri:
+        raise HTTPException(
+            status_code=400,
+            detail="Missing blend_gcs_uri; upload the .blend first or use /render-binary",
+        )
     job_id = str(uuid.uuid4())
-    tmp_dir = Path(tempfile.mkdtemp(prefix="rfarm_"))
-    blend_path: Optional[Path] = None
+    slot = await _acquire_slot()
+    response: Optional[Union[ORJSONResponse, FileResponse]] = None
     try:
-        if request.blend_gcs_uri:
-            blend_path = _download_blend_from_gcs(tmp_dir, request.blend_gcs_uri)
-        elif request.blend_file:
-            blend_path = _write_blend_file(tmp_dir, request.blend_file)
-        else:
-            raise HTTPException(status_code=400, detail="Missing blend file reference")
-        result = _run_blender(blend_path, request)
-        output_path = Path(result["output_path"])
-        output_format = output_path.suffix.lstrip(".").upper() or request.render_settings.file_format or "PNG"
-        return RenderResponse(
-            job_id=job_id,
-            image_base64=result["image_base64"],
-            output_format=output_format,
-            output_path=str(output_path),
-            logs=result["logs"],
+        blend_path = await asyncio.to_thread(_download_blend_from_gcs, slot.path, request.blend_gcs_uri)
+        response = await _render_response(
+            job_id, blend_path, request, _accepts_binary(accept), inline, slot
+        )
+        return response
+    finally:
+        if not isinstance(response, FileResponse):
+            slot.release()
+
+
+@app.post("/render-binary", response_model=RenderResponse)
+async def render_binary_endpoint(
+    raw_request: Request, inline: bool = True
+) -> Union[ORJSONResponse, FileResponse]:
+    """Render a .blend sent as the raw request body, with the settings in a header.
+
+    Used when Cloud Storage uploads are unavailable; the file is streamed to disk
+    as it arrives instead of being base64-encoded inside a JSON document.
+    """
+
+    request = _parse_metadata_header(raw_request)
+    expected_sha256 = raw_request.headers.get("x-content-sha256")
+    if expected_sha256 is not None:
+        expected_sha256 = expected_sha256.strip().lower()
+        if not SHA256_HEX.match(expected_sha256):
+            raise HTTPException(status_code=400, detail="Invalid X-Content-SHA256 header")
+    job_id = str(uuid.uuid4())
+    slot = await _acquire_slot()
+    blend_path = slot.path / "scene.blend"
+    response: Optional[Union[ORJSONResponse, FileResponse]] = None
+    try:
+        digest = hashlib.sha256()
+        loop = asyncio.get_running_loop()
+        with open(blend_path, "wb") as handle:
+            async for chunk in raw_request.stream():
+                digest.update(chunk)
+                # Keep disk writes off the event loop so other requests stay responsive.
+                await loop.run_in_executor(None, handle.write, chunk)
+        if blend_path.stat().st_size == 0:
+            raise HTTPException(status_code=400, detail="Missing blend file body")
+        if expected_sha256 and digest.hexdigest() != expected_sha256:
+            raise HTTPException(status_code=400, detail="Blend file does not match X-Content-SHA256")
+        response = await _render_response(
+            job_id,
+            blend_path,
+            request,
+            _accepts_binary(raw_request.headers.get("accept")),
+            inline,
+            slot,
         )
+        return response
     finally:
-        if blend_path and blend_path.exists():
+        if not isinstance(response, FileResponse):
+            slot.release()
+
+
+@app.get("/render/{job_id}/image")
+async def render_image_endpoint(job_id: str) -> FileResponse:
+    """Serve the image of a render requested with ``inline=false``."""
+
+    _evict_retained_results()
+    retained = _retained_results.get(job_id)
+    if retained is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired render result")
+    path, output_format, _ = retained
+    return FileResponse(
+        path,
+        media_type="application/octet-stream",
+        headers={"X-RFarm-Job-Id": job_id, "X-RFarm-Output-Format": output_format},
+    )
+
+
+def _render_batch_lines(slot: _JobSlot, blend_path: Path, request: BatchRenderRequest) -> Iterator[bytes]:
+    """Render each requested frame in turn, yielding one NDJSON line per frame.
+
+    A failed frame produces an ``error`` line instead of aborting the batch. The job
+    slot is released when the generator finishes; the response's background task
+    covers clients that disconnect before it does.
+    """
+
+    try:
+        for frame in request.frames:
+            # The fields were validated with the batch; skip validating them per frame.
+            frame_request = RenderRequest.model_construct(
+                frame=frame,
+                blend_gcs_uri=request.blend_gcs_uri,
+                render_settings=request.render_settings,
+                device=request.device,
+                compute_device_type=request.compute_device_type,
+            )
+            try:
+                result = _run_blender(blend_path, frame_request)
+            except HTTPException as exc:
+                yield orjson.dumps({"frame": frame, "error": exc.detail}) + b"\n"
+                continue
+
+            output_path = Path(result["output_path"])
             try:
-                blend_path.unlink()
-            except OSError:
-                pass
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+                line = {
+                    "job_id": str(uuid.uuid4()),
+                    "frame": frame,
+                    "output_format": _output_format(output_path, request.render_settings),
+                    "image_base64": pybase64.b64encode(output_path.read_bytes()).decode("ascii"),
+                }
+            finally:
+                # Keep only the current frame in the output directory.
+                output_path.unlink(missing_ok=True)
+            yield orjson.dumps(line) + b"\n"
+    finally:
+        slot.release()
 
 
-@app.post("/upload-url", response_model=BlendUploadResponse)
-async def create_upload_url(request: BlendUploadRequest) -> BlendUploadResponse:
+@app.post("/render-batch", openapi_extra={"requestBody": _json_request_body_schema(BatchRenderRequest)})
+async def render_batch_endpoint(
+    request: BatchRenderRequest = Depends(_batch_render_request_body),
+) -> StreamingResponse:
+    """Render a frame range from one uploaded .blend, streaming results as NDJSON."""
+
+    slot = await _acquire_slot()
+    try:
+        blend_path = await asyncio.to_thread(_download_blend_from_gcs, slot.path, request.blend_gcs_uri)
+    except BaseException:
+        slot.release()
+        raise
+    return StreamingResponse(
+        _render_batch_lines(slot, blend_path, request),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(slot.release),
+    )
+
+
+def _create_upload_url(request: BlendUploadRequest) -> BlendUploadResponse:
     if not GCS_BUCKET:
-        raise HTTPException(status_code=500, detail="RFARM_GCS_BUCKET is not configured")
+        # 501 tells clients to fall back to sending the file through /render-binary.
+        raise HTTPException(status_code=501, detail="RFARM_GCS_BUCKET is not configured")
+
+    from google.api_core import exceptions as gcs_exceptions
 
-    object_name = f"uploads/{uuid.uuid4()}/{request.filename}"
+    if request.sha256:
+        object_name = f"uploads/sha256/{request.sha256}/{request.filename}"
+    else:
+        object_name = f"uploads/{uuid.uuid4()}/{request.filename}"
     expiration = timedelta(minutes=SIGNED_URL_TTL_MINUTES)
+    gcs_uri = f"gs://{GCS_BUCKET}/{object_name}"
 
     try:
         client = _get_storage_client()
         bucket = client.bucket(GCS_BUCKET)
         blob = bucket.blob(object_name)
-        service_account_email = _get_service_account_email()
-        if not service_account_email:
-            raise HTTPException(
-                status_code=500,
-                detail="Unable to determine service account email for signing upload URLs.",
+        # Only reuse an object whose content the server has checked against the digest;
+        # an unverified one is overwritten by this client's upload.
+        existing = bucket.get_blob(object_name) if request.sha256 else None
+        if existing is not None and (existing.metadata or {}).get(VERIFIED_SHA256_METADATA_KEY) == request.sha256:
+            return BlendUploadResponse(
+                blob_name=object_name,
+                gcs_uri=gcs_uri,
+                expires_in=0,
+                already_uploaded=True,
             )
 
-        signing_credentials = _get_signing_credentials(service_account_email)
-        upload_url = blob.generate_signed_url(
-            version="v4",
-            expiration=expiration,
-            method="PUT",
-            content_type="application/octet-stream",
-            service_account_email=service_account_email,
-            credentials=signing_credentials,
-        )
+        upload_url = _sign_blob_url(blob, "PUT", expiration, content_type="application/octet-stream")
     except gcs_exceptions.GoogleAPIError as exc:
         raise HTTPException(status_code=502, detail=f"Failed to generate upload URL: {exc}") from exc
 
-    gcs_uri = f"gs://{GCS_BUCKET}/{object_name}"
     return BlendUploadResponse(
         upload_url=upload_url,
         blob_name=object_name,
@@ -370,6 +1134,86 @@ async def create_upload_url(request: BlendUploadRequest) -> BlendUploadResponse:
     )
 
 
+def _take_pooled_upload_url() -> Optional[Tuple[str, str, float]]:
+    """Pop a pre-signed upload URL with at least half of its lifetime left, if any."""
+
+    while True:
+        try:
+            object_name, upload_url, expires_at = _upload_url_pool.popleft()
+        except IndexError:
+            return None
+        remaining = expires_at - time.monotonic()
+        if remaining >= UPLOAD_URL_MIN_REMAINING_SECONDS:
+            return object_name, upload_url, remaining
+
+
+def _fill_upload_url_pool() -> None:
+    """Drop stale pre-signed upload URLs and sign new ones up to the pool size."""
+
+    now = time.monotonic()
+    while True:
+        try:
+            if _upload_url_pool[0][2] - now >= UPLOAD_URL_MIN_REMAINING_SECONDS:
+                break
+            _upload_url_pool.popleft()
+        except IndexError:
+            break
+
+    expiration = timedelta(minutes=SIGNED_URL_TTL_MINUTES)
+    bucket = _get_storage_client().bucket(GCS_BUCKET)
+    while len(_upload_url_pool) < UPLOAD_URL_POOL_SIZE:
+        object_name = f"uploads/{uuid.uuid4()}/{DEFAULT_BLEND_FILENAME}"
+        expires_at = time.monotonic() + expiration.total_seconds()
+        upload_url = _sign_blob_url(
+            bucket.blob(object_name), "PUT", expiration, content_type="application/octet-stream"
+        )
+        _upload_url_pool.append((object_name, upload_url, expires_at))
+
+
+async def _maintain_upload_url_pool() -> None:
+    delay = UPLOAD_URL_POOL_REFILL_SECONDS
+    while True:
+        try:
+            await asyncio.to_thread(_fill_upload_url_pool)
+            delay = UPLOAD_URL_POOL_REFILL_SECONDS
+        except Exception:  # noqa: BLE001 - the endpoint signs on demand meanwhile
+            delay = min(delay * 2, UPLOAD_URL_POOL_MAX_BACKOFF_SECONDS)
+            logger.warning("Failed to fill the upload URL pool; retrying in %ss", delay, exc_info=True)
+        await asyncio.sleep(delay)
+
+
+async def _start_upload_url_pool() -> None:
+    global _upload_url_pool_task
+    if GCS_BUCKET and UPLOAD_URL_POOL_SIZE > 0:
+        _upload_url_pool_task = asyncio.create_task(_maintain_upload_url_pool())
+
+
+async def _stop_upload_url_pool() -> None:
+    if _upload_url_pool_task is not None:
+        _upload_url_pool_task.cancel()
+
+
+app.add_event_handler("startup", _start_upload_url_pool)
+app.add_event_handler("shutdown", _stop_upload_url_pool)
+
+
+@app.post("/upload-url", response_model=BlendUploadResponse)
+async def create_upload_url(request: BlendUploadRequest) -> BlendUploadResponse:
+    # Uploads without a digest get a random object name, so a URL signed in advance fits.
+    if GCS_BUCKET and not request.sha256 and request.filename == DEFAULT_BLEND_FILENAME:
+        pooled = _take_pooled_upload_url()
+        if pooled is not None:
+            object_name, upload_url, remaining = pooled
+            return BlendUploadResponse(
+                upload_url=upload_url,
+                blob_name=object_name,
+                gcs_uri=f"gs://{GCS_BUCKET}/{object_name}",
+                expires_in=int(remaining),
+            )
+    # The existence check and URL signing may call Google APIs; keep them off the loop.
+    return await asyncio.to_thread(_create_upload_url, request)
+
+
 @app.post("/upload", response_model=BlendUploadResponse, include_in_schema=False)
 async def create_upload_url_legacy(request: BlendUploadRequest) -> BlendUploadResponse:
     """Compatibility shim for older Blender add-on versions."""
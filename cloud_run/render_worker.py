@@ -7,6 +7,9 @@ from pathlib import Path
 
 import bpy
 
+# Prefix for the result line so the service can find it without parsing every log line.
+RESULT_MARKER = "__RFARM_RESULT__"
+
 
 def _configure_cycles(device: str, compute_device: str) -> None:
     cycles_addon = bpy.context.preferences.addons.get("cycles")
@@ -76,7 +79,7 @@ def _apply_render_settings(args: argparse.Namespace) -> None:
     scene.render.filepath = str(output_dir / args.output_basename)
 
 
-def main(argv: list[str]) -> None:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Execute a single Cycles render")
     parser.add_argument("--frame", type=int, required=True)
     parser.add_argument("--output-dir", required=True)
@@ -91,17 +94,46 @@ def main(argv: list[str]) -> None:
     parser.add_argument("--color-mode", default=None)
     parser.add_argument("--color-depth", default=None)
     parser.add_argument("--use-adaptive-sampling", default=None)
+    return parser
 
-    args = parser.parse_args(argv)
 
+def _render(args: argparse.Namespace) -> str:
     bpy.context.scene.frame_set(args.frame)
     _configure_cycles(args.device, args.compute_device)
     _apply_render_settings(args)
 
     bpy.ops.render.render(write_still=True)
 
-    output_path = bpy.path.abspath(bpy.context.scene.render.frame_path(frame=args.frame))
-    print(json.dumps({"output_path": output_path}))
+    return bpy.path.abspath(bpy.context.scene.render.frame_path(frame=args.frame))
+
+
+def main(argv: list[str]) -> None:
+    args = _build_parser().parse_args(argv)
+    output_path = _render(args)
+    print(RESULT_MARKER + json.dumps({"output_path": output_path}))
+
+
+def serve() -> None:
+    """Render one frame per JSON command read from stdin until stdin is closed.
+
+    Each command is ``{"blend_path": ..., "argv": [...]}`` where ``argv`` holds the
+    same arguments as a single-shot run. Keeping the process alive avoids paying
+    Blender start-up and Cycles device initialisation for every frame.
+    """
+
+    parser = _build_parser()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            command = json.loads(line)
+            args = parser.parse_args(command["argv"])
+            bpy.ops.wm.open_mainfile(filepath=command["blend_path"])
+            output_path = _render(args)
+        except (Exception, SystemExit) as exc:  # noqa: BLE001 - report and keep serving
+            print(RESULT_MARKER + json.dumps({"event": "render_failed", "error": str(exc)}), flush=True)
+            continue
+        print(RESULT_MARKER + json.dumps({"event": "render_done", "output_path": output_path}), flush=True)
 
 
 if __name__ == "__main__":
@@ -109,4 +141,7 @@ if __name__ == "__main__":
         arg_list = sys.argv[sys.argv.index("--") + 1 :]
     else:
         arg_list = sys.argv[1:]
-    main(arg_list)
+    if arg_list == ["--serve"]:
+        serve()
+    else:
+        main(arg_list)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The worker runs as a top-level ``app`` module (``uvicorn app:app``).
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
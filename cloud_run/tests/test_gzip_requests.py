@@ -0,0 +1,63 @@
+import gzip
+import json
+
+import pybase64
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app  # noqa: E402
+
+METADATA = pybase64.b64encode(json.dumps({"frame": 1}).encode("utf-8")).decode("ascii")
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "SLOT_ROOT", tmp_path)
+    monkeypatch.setattr(app, "_slot_pool", None)
+    # Not used as a context manager, so the startup warm-up tasks do not run.
+    return TestClient(app.app)
+
+
+def test_healthz_through_middleware_stack(client):
+    response = client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json()["request_encoding"] == "gzip"
+
+
+def test_gzip_rejected_outside_render_binary(client):
+    response = client.post(
+        "/render",
+        content=gzip.compress(b'{"frame": 1}'),
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 415
+
+
+def test_truncated_gzip_body_is_rejected(client):
+    body = gzip.compress(b"blend" * 1000)[:-8]
+
+    response = client.post(
+        "/render-binary",
+        content=body,
+        headers={"Content-Encoding": "gzip", "X-RFarm-Metadata": METADATA},
+    )
+
+    assert response.status_code == 400
+
+
+def test_inflated_size_is_capped(client, monkeypatch):
+    monkeypatch.setattr(app, "MAX_INFLATED_BODY_BYTES", 1 << 16)
+
+    response = client.post(
+        "/render-binary",
+        content=gzip.compress(bytes(1 << 20)),
+        headers={"Content-Encoding": "gzip", "X-RFarm-Metadata": METADATA},
+    )
+
+    assert response.status_code == 413
@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import app  # noqa: E402
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "SLOT_ROOT", tmp_path)
+    monkeypatch.setattr(app, "_slot_pool", None)
+    return TestClient(app.app)
+
+
+def test_render_rejects_malformed_json(client):
+    response = client.post("/render", content=b'{"frame": ', headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 400
+
+
+def test_render_rejects_invalid_fields(client):
+    response = client.post("/render", json={"frame": "first"})
+
+    assert response.status_code == 422
+
+
+def test_render_requires_blend_gcs_uri(client):
+    response = client.post("/render", json={"frame": 1})
+
+    assert response.status_code == 400
+    assert "blend_gcs_uri" in response.json()["detail"]
+
+
+def test_render_batch_rejects_empty_frames(client):
+    response = client.post("/render-batch", json={"frames": [], "blend_gcs_uri": "gs://bucket/scene.blend"})
+
+    assert response.status_code == 422
+
+
+def test_request_bodies_are_documented(client):
+    paths = client.get("/openapi.json").json()["paths"]
+
+    for path, field in (("/render", "frame"), ("/render-batch", "frames")):
+        schema = paths[path]["post"]["requestBody"]["content"]["application/json"]["schema"]
+        assert field in schema["properties"]
+        assert "$ref" not in str(schema)
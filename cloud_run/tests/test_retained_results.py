@@ -0,0 +1,54 @@
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException  # noqa: E402
+
+import app  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "RESULTS_DIR", tmp_path / "results")
+    monkeypatch.setattr(app, "_retained_results", OrderedDict())
+    return tmp_path / "results"
+
+
+def _retain(tmp_path, job_id):
+    output_path = tmp_path / f"{job_id}.png"
+    output_path.write_bytes(b"image")
+    app._retain_result(job_id, output_path, "PNG")
+
+
+def test_served_while_retained(tmp_path, results_dir):
+    _retain(tmp_path, "job")
+
+    response = asyncio.run(app.render_image_endpoint("job"))
+
+    assert response.path == results_dir / "job.png"
+    assert response.headers["x-rfarm-output-format"] == "PNG"
+
+
+def test_limit_evicts_oldest(tmp_path, results_dir, monkeypatch):
+    monkeypatch.setattr(app, "RESULT_RETENTION_LIMIT", 1)
+
+    _retain(tmp_path, "first")
+    _retain(tmp_path, "second")
+
+    assert list(app._retained_results) == ["second"]
+    assert not (results_dir / "first.png").exists()
+    assert (results_dir / "second.png").exists()
+
+
+def test_expired_result_is_not_served(tmp_path, results_dir, monkeypatch):
+    monkeypatch.setattr(app, "RESULT_RETENTION_SECONDS", 0)
+
+    _retain(tmp_path, "job")
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(app.render_image_endpoint("job"))
+    assert excinfo.value.status_code == 404
+    assert not (results_dir / "job.png").exists()
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from collections import deque
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+import app  # noqa: E402
+
+
+class _Bucket:
+    def blob(self, name):
+        return name
+
+
+class _Client:
+    def bucket(self, name):
+        return _Bucket()
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    monkeypatch.setattr(app, "GCS_BUCKET", "bucket")
+    monkeypatch.setattr(app, "UPLOAD_URL_POOL_SIZE", 2)
+    monkeypatch.setattr(app, "_upload_url_pool", deque())
+    monkeypatch.setattr(app, "_get_storage_client", lambda: _Client())
+    monkeypatch.setattr(
+        app, "_sign_blob_url", lambda blob, method, expiration, content_type=None: f"https://signed/{blob}"
+    )
+    return app._upload_url_pool
+
+
+def test_fill_signs_up_to_pool_size(pool):
+    app._fill_upload_url_pool()
+
+    assert len(pool) == 2
+    for object_name, upload_url, _ in pool:
+        assert object_name.endswith(f"/{app.DEFAULT_BLEND_FILENAME}")
+        assert upload_url == f"https://signed/{object_name}"
+
+
+def test_fill_replaces_stale_urls(pool):
+    pool.append(("uploads/stale/scene.blend", "https://signed/stale", time.monotonic()))
+
+    app._fill_upload_url_pool()
+
+    assert len(pool) == 2
+    assert "uploads/stale/scene.blend" not in [entry[0] for entry in pool]
+
+
+def test_endpoint_hands_out_pooled_url(pool):
+    app._fill_upload_url_pool()
+    object_name, upload_url, _ = pool[0]
+
+    response = asyncio.run(app.create_upload_url(app.BlendUploadRequest()))
+
+    assert response.upload_url == upload_url
+    assert response.gcs_uri == f"gs://bucket/{object_name}"
+    assert response.expires_in >= app.UPLOAD_URL_MIN_REMAINING_SECONDS - 1
+    assert len(pool) == 1
+
+
+def test_endpoint_skips_stale_pooled_url(pool):
+    pool.append(("uploads/stale/scene.blend", "https://signed/stale", time.monotonic()))
+
+    response = asyncio.run(app.create_upload_url(app.BlendUploadRequest()))
+
+    assert response.upload_url != "https://signed/stale"
+    assert not pool